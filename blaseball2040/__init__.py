@@ -1,8 +1,20 @@
 root_dir = '/'.join(__file__.rsplit('/')[:-1])
 assets_dir = f'{root_dir}/assets'
 
-def start():
+def start(timing: bool = False):
+  # Only the splash screen is loaded before the logo is drawn, the other
+  # screens are imported on first use. With `timing`, each step of getting
+  # the logo on the panel is timed and printed.
+  timer = None
+  if timing:
+    from blaseball2040.startup import SPLASH_MODULES, StartupTimer
+    timer = StartupTimer()
+    for module in SPLASH_MODULES:
+      timer.load(module)
+
   from blaseball2040.app import MyApp
 
-  app = MyApp()
+  app = MyApp(timer)
+  if timer is not None:
+    timer.mark('MyApp()')
   app.run()
@@ -1,17 +1,188 @@
+import time
+
 import badger2040
-from badger_ui import App
+from badger_ui import App, Offset, Size
+from blaseball2040.buttons import ButtonQueue
+from blaseball2040.framebuffer import BANDS, SIZE, diff_frames
+from blaseball2040.image import find_delta
+from blaseball2040.refresh import Refresh, RefreshScheduler
+from blaseball2040.screens import ScreenPool
 from blaseball2040.splash_screen import SplashScreen
 
+BUTTONS = (
+    badger2040.BUTTON_A,
+    badger2040.BUTTON_B,
+    badger2040.BUTTON_C,
+    badger2040.BUTTON_UP,
+    badger2040.BUTTON_DOWN,
+    badger2040.BUTTON_USER,
+)
+
 
 class MyApp(App):
-  def __init__(self):
+  def __init__(self, timer: 'StartupTimer | None' = None):
     super().__init__()
 
-    self.child = SplashScreen()
+    # Draw into a framebuffer we own, so each frame can be diffed against
+    # the last one sent to the panel and only the changed bands updated.
+    self.framebuffer = bytearray(SIZE)
+    self.display = badger2040.Badger2040(buffer=self.framebuffer)
+    self.refresh = RefreshScheduler()
+    self.buttons = ButtonQueue(BUTTONS)
+    self.pressed = {button: 0 for button in BUTTONS}
+    self.shown: bytearray | None = None
+    self.bounds = [0, 0, 0, 0]
+    self.inverted = False
+    self.invert_changed = False
+    # Whether the last batch of presses moved to another screen
+    self.moved = False
+    # Times the first render of each screen, see blaseball2040.startup
+    self.timer = timer
+    self.rendered: set[type] = set()
+
+    self.screens = ScreenPool()
+    self.child = self.screens.get(SplashScreen)
+
+    # Full-screen art on the panel with nothing drawn over it. A screen whose
+    # `background` art has a delta from it is reached without a full redraw.
+    self.panel: str | None = None
+    # Art already in the framebuffer when the screen starts rendering
+    self.backdrop: str | None = None
+    # Union of the areas invalidated during a render, as (x0, y0, x1, y1)
+    self.damage: tuple[int, int, int, int] | None = None
 
   def on_button(self, app: 'App', pressed: dict[int, bool]) -> bool:
     if pressed[badger2040.BUTTON_USER]:
-      app.child = SplashScreen()
+      app.child = app.screens.get(SplashScreen)
       return True
 
     return super().on_button(app, pressed)
+
+  def invert(self, inverted: bool):
+    # Inverting doesn't touch the framebuffer, so it has to force an update
+    if inverted != self.inverted:
+      self.inverted = inverted
+      self.invert_changed = True
+      self.display.invert(inverted)
+
+  def invalidate(self, x: int, y: int, width: int, height: int):
+    self.display.pen(15)
+    self.display.rectangle(x, y, width, height)
+
+    x1 = x + width
+    y1 = y + height
+    if self.damage is not None:
+      x = min(x, self.damage[0])
+      y = min(y, self.damage[1])
+      x1 = max(x1, self.damage[2])
+      y1 = max(y1, self.damage[3])
+    self.damage = (x, y, x1, y1)
+
+  def present_damage(self):
+    # Re-render over the current frame. Only widgets whose state changed clear
+    # and invalidate their area, everything else draws over itself unchanged.
+    self.damage = None
+    self.child.render(self, Size(badger2040.WIDTH, badger2040.HEIGHT), Offset(0, 0))
+    if self.damage is not None:
+      self.flush(max(self.damage[0], 0), min(self.damage[2], badger2040.WIDTH))
+
+  def present(self, transition: bool = False):
+    child = self.child
+    timed = self.timer is not None and type(child) not in self.rendered
+    if timed:
+      self.rendered.add(type(child))
+      self.timer.lap()
+    background = getattr(child, 'background', None)
+    overlay = getattr(child, 'overlay', True)
+
+    # Only logo to vs can take this path. The select screen draws over its
+    # art, so leaving it sets panel to None and vs to logo redraws in full.
+    delta = None
+    if background is not None and self.panel is not None and self.panel != background:
+      delta = find_delta(self.panel, background)
+
+    if delta is not None:
+      delta.draw(self.display, Offset(0, 0))
+      self.backdrop = background
+    else:
+      self.display.pen(15)
+      self.display.clear()
+      self.backdrop = None
+
+    child.render(self, Size(badger2040.WIDTH, badger2040.HEIGHT), Offset(0, 0))
+    self.panel = None if overlay else background
+    if timed:
+      self.timer.mark(f'render {type(child).__name__}')
+
+    self.flush(0, badger2040.WIDTH, transition)
+    if timed:
+      self.timer.mark(f'update {type(child).__name__}')
+
+  def flush(self, x0: int, x1: int, transition: bool = False):
+    # Send the bands that differ from the frame on the panel, only columns
+    # x0 to x1 can have changed.
+    if self.shown is None or self.invert_changed:
+      self.bounds[:] = [0, 0, badger2040.WIDTH, BANDS]
+    elif not diff_frames(self.shown, self.framebuffer, x0, x1, self.bounds):
+      return
+    self.invert_changed = False
+
+    refresh = self.refresh.choose(
+        transition or self.shown is None,
+        getattr(self.child, 'background', None) is not None,
+    )
+    self.display.update_speed(self.refresh.speed(refresh))
+    if refresh == Refresh.CLEAN:
+      self.display.update()
+    else:
+      left, top, right, bottom = self.bounds
+      self.display.partial_update(left, top * 8, right - left, (bottom - top) * 8)
+
+    if self.shown is None:
+      self.shown = bytearray(self.framebuffer)
+    else:
+      self.shown[:] = self.framebuffer
+
+  def dismiss(self, screen):
+    # Lets a screen that's been left give back assets it no longer needs
+    dismiss = getattr(screen, 'dismiss', None)
+    if dismiss is not None:
+      dismiss(self)
+
+  def dispatch(self, events: list[list[int]]) -> bool:
+    # Applies every queued press before the next render. Each event is sent
+    # on its own, with the press count as the button's value in `pressed`.
+    # Every screen a press moves away from is dismissed straight away, even
+    # if a later press in the batch comes back to it, and `moved` is set.
+    handled = False
+    pressed = self.pressed
+    self.moved = False
+    for button, amount in events:
+      child = self.child
+      pressed[button] = amount
+      if self.on_button(self, pressed):
+        handled = True
+      pressed[button] = 0
+      if self.child is not child:
+        self.dismiss(child)
+        self.moved = True
+    return handled
+
+  def handle(self, events: list[list[int]]):
+    if self.dispatch(events):
+      if self.moved:
+        self.present(transition=True)
+      elif getattr(self.child, 'partial', False):
+        self.present_damage()
+      else:
+        self.present()
+
+  def run(self):
+    self.present(transition=True)
+    while True:
+      events = self.buttons.poll()
+      if not events:
+        time.sleep_ms(10)
+        continue
+
+      self.handle(events)
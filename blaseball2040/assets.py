@@ -0,0 +1,203 @@
+import os
+
+from blaseball2040 import assets_dir
+
+# Frozen package written by `image_converter.py --freeze`. Its modules are
+# baked into the firmware, so their data is a memoryview straight into flash.
+FROZEN_PACKAGE = 'blaseball2040_assets'
+
+_frozen = {}
+_exists = {}
+
+
+def module_name(name: str) -> str:
+  return name.replace('.', '_')
+
+
+def frozen(name: str) -> memoryview | None:
+  try:
+    return _frozen[name]
+  except KeyError:
+    pass
+
+  try:
+    module = __import__(f'{FROZEN_PACKAGE}.{module_name(name)}', None, None, ('data',))
+    data = module.data()
+  except ImportError:
+    data = None
+  _frozen[name] = data
+  return data
+
+
+def path(name: str) -> str:
+  return f'{assets_dir}/{name}'
+
+
+def exists(name: str) -> bool:
+  try:
+    return _exists[name]
+  except KeyError:
+    pass
+
+  found = frozen(name) is not None
+  if not found:
+    try:
+      os.stat(path(name))
+      found = True
+    except OSError:
+      pass
+  _exists[name] = found
+  return found
+
+
+class MemoryReader:
+  """
+  The subset of the file API the image classes use, over a memoryview.
+  """
+
+  def __init__(self, data: memoryview):
+    self.data = data
+    self.pos = 0
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *args):
+    pass
+
+  def seek(self, pos: int):
+    self.pos = pos
+
+  def readinto(self, buf) -> int:
+    n = min(len(buf), len(self.data) - self.pos)
+    buf[:n] = self.data[self.pos:self.pos + n]
+    self.pos += n
+    return n
+
+
+class AssetHandle:
+  """
+  A shared reference to an asset in the registry. While any handle to an
+  asset is held it won't be evicted.
+  """
+
+  def __init__(self, registry: 'AssetRegistry', name: str):
+    self.registry = registry
+    self.name = name
+
+  def data(self) -> memoryview | None:
+    return self.registry.load(self.name)
+
+  def release(self):
+    self.registry.release(self.name)
+
+
+class AssetRegistry:
+  """
+  Holds asset data in RAM for every screen to share, within a byte budget.
+
+  Frozen assets already live in flash and cost nothing. Others are read
+  whole into RAM when they fit in the budget, evicting the least recently
+  used unreferenced assets to make room. Assets that still don't fit, or
+  that the heap can't find a block for, are streamed from their file
+  instead, so the heap never holds more than `budget` bytes of asset data.
+  Full-screen art goes through stream() and is never cached.
+
+  `hits`, `misses` and `evictions` count RAM cache lookups.
+  """
+
+  def __init__(self, budget: int = 8192):
+    self.budget = budget
+    self.used = 0
+    self.clock = 0
+    self.data: dict[str, memoryview] = {}
+    self.used_at: dict[str, int] = {}
+    self.refs: dict[str, int] = {}
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+
+  def acquire(self, name: str) -> AssetHandle:
+    self.refs[name] = self.refs.get(name, 0) + 1
+    return AssetHandle(self, name)
+
+  def release(self, name: str):
+    refs = self.refs[name] - 1
+    if refs:
+      self.refs[name] = refs
+    else:
+      del self.refs[name]
+    self.trim(self.budget)
+
+  def evict(self, name: str):
+    self.used -= len(self.data.pop(name))
+    del self.used_at[name]
+    self.evictions += 1
+
+  def trim(self, budget: int) -> bool:
+    # Evicts unreferenced assets, oldest first, until at most `budget` bytes
+    # are used. Returns False, evicting nothing, if the referenced ones alone
+    # are over it.
+    referenced = 0
+    for name in self.refs:
+      data = self.data.get(name)
+      if data is not None:
+        referenced += len(data)
+    if referenced > budget:
+      return False
+
+    while self.used > budget:
+      oldest = None
+      for name, used_at in self.used_at.items():
+        if name not in self.refs and (oldest is None or used_at < self.used_at[oldest]):
+          oldest = name
+      self.evict(oldest)
+    return True
+
+  def load(self, name: str) -> memoryview | None:
+    data = frozen(name)
+    if data is not None:
+      return data
+
+    self.clock += 1
+    data = self.data.get(name)
+    if data is not None:
+      self.hits += 1
+      self.used_at[name] = self.clock
+      return data
+
+    self.misses += 1
+    size = os.stat(path(name))[6]
+    if size > self.budget or not self.trim(self.budget - size):
+      return None
+
+    try:
+      data = bytearray(size)
+    except MemoryError:
+      # The heap has room but no single block this big, stream it instead
+      return None
+    with open(path(name), 'rb') as f:
+      f.readinto(data)
+    data = memoryview(data)
+    self.data[name] = data
+    self.used_at[name] = self.clock
+    self.used += size
+    return data
+
+  def stream(self, name: str):
+    # Opens the asset without reading it into RAM: for art that's drawn
+    # once per visit and would only crowd out the shared assets.
+    data = frozen(name)
+    if data is not None:
+      return MemoryReader(data)
+    return open(path(name), 'rb')
+
+  def report(self) -> str:
+    return f'{self.used}/{self.budget} bytes, hits: {self.hits}, misses: {self.misses}, evictions: {self.evictions}'
+
+
+registry = AssetRegistry()
+
+
+def open_asset(name: str):
+  return registry.stream(name)
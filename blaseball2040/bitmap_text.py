@@ -0,0 +1,50 @@
+from badger_ui import App, Offset, Size, Widget
+
+from blaseball2040 import glyphs
+from blaseball2040.assets import path
+from blaseball2040.image import Asset, blit
+
+# Every screen draws text, so once the first text is drawn the atlas is held
+# for the life of the app. Importing the module doesn't load it.
+_atlas = Asset(glyphs.ATLAS)
+
+
+class BitmapText(Widget):
+  """
+  Text blitted from the glyph atlas (`image_converter.py --font`), which is
+  rasterized from the badge's own Hershey font, instead of stroked as vector
+  text. Only the line heights and characters listed in blaseball2040.glyphs
+  can be drawn, other characters are skipped.
+  """
+
+  def __init__(self, text: str, line_height: int):
+    self.text = text
+    self.line_height = line_height
+
+  def measure(self, app: 'App', size: Size) -> Size:
+    chars, widths, _ = glyphs.SIZES[self.line_height]
+    width = 0
+    for char in self.text:
+      index = chars.find(char)
+      if index >= 0:
+        width += widths[index]
+    return Size(width, self.line_height)
+
+  def draw(self, app: 'App', source, offset: Offset):
+    chars, widths, offsets = glyphs.SIZES[self.line_height]
+    x = offset.x
+    for char in self.text:
+      index = chars.find(char)
+      if index < 0:
+        continue
+      blit(app.framebuffer, source, offsets[index], widths[index], self.line_height, x, offset.y)
+      x += widths[index]
+
+  def render(self, app: 'App', size: Size, offset: Offset):
+    data = _atlas.asset().data()
+    if data is not None:
+      self.draw(app, data, offset)
+      return
+
+    with open(path(glyphs.ATLAS), 'rb') as f:
+      self.draw(app, f, offset)
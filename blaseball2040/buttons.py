@@ -0,0 +1,94 @@
+import time
+
+import badger2040
+from machine import Pin
+
+# Buttons that step a value and so repeat and accelerate while held
+REPEAT_BUTTONS = (
+    badger2040.BUTTON_UP,
+    badger2040.BUTTON_DOWN,
+)
+
+
+class ButtonQueue:
+  """
+  Collects button presses from pin interrupts, so presses that arrive while
+  the panel is busy refreshing are queued rather than lost.
+
+  poll() returns the queued presses in order as [button, amount] events.
+  Back to back presses of UP or DOWN are merged into one event, and holding
+  either repeats it with a step that grows from 1 to 5 to 10.
+  """
+
+  debounce_ms = 30
+  repeat_delay_ms = 500
+  repeat_ms = 200
+  # (held for at least ms, step)
+  steps = (
+      (2500, 10),
+      (1200, 5),
+      (0, 1),
+  )
+
+  def __init__(self, buttons: tuple[int, ...]):
+    self.events: list[list[int]] = []
+    self.pins: dict[int, Pin] = {}
+    self.pressed_at: dict[int, int] = {}
+    self.repeated_at: dict[int, int] = {}
+
+    for button in buttons:
+      # The user button is wired active low, the others active high
+      if button == badger2040.BUTTON_USER:
+        pin = Pin(button, Pin.IN, Pin.PULL_UP)
+        trigger = Pin.IRQ_FALLING
+      else:
+        pin = Pin(button, Pin.IN, Pin.PULL_DOWN)
+        trigger = Pin.IRQ_RISING
+      pin.irq(trigger=trigger, handler=lambda pin, button=button: self.on_press(button))
+      self.pins[button] = pin
+
+  def held(self, button: int) -> bool:
+    return self.pins[button].value() == (0 if button == badger2040.BUTTON_USER else 1)
+
+  def on_press(self, button: int):
+    now = time.ticks_ms()
+    last = self.pressed_at.get(button)
+    if last is not None and time.ticks_diff(now, last) < self.debounce_ms:
+      return
+    self.pressed_at[button] = now
+    self.repeated_at[button] = time.ticks_add(now, self.repeat_delay_ms - self.repeat_ms)
+    self.push(button, 1)
+
+  def push(self, button: int, amount: int):
+    if button in REPEAT_BUTTONS and self.events and self.events[-1][0] == button:
+      self.events[-1][1] += amount
+    else:
+      self.events.append([button, amount])
+
+  def step(self, held_ms: int) -> int:
+    for at_least, step in self.steps:
+      if held_ms >= at_least:
+        return step
+    return 1
+
+  def repeat(self):
+    # Every repeat period that passed while held adds one step, so time
+    # spent refreshing the panel still counts.
+    now = time.ticks_ms()
+    for button in REPEAT_BUTTONS:
+      if button not in self.pins or button not in self.pressed_at or not self.held(button):
+        continue
+
+      periods = time.ticks_diff(now, self.repeated_at[button]) // self.repeat_ms
+      if periods <= 0:
+        continue
+
+      held_ms = time.ticks_diff(now, self.pressed_at[button])
+      self.repeated_at[button] = time.ticks_add(self.repeated_at[button], periods * self.repeat_ms)
+      self.push(button, periods * self.step(held_ms))
+
+  def poll(self) -> list[list[int]]:
+    self.repeat()
+    events = self.events
+    self.events = []
+    return events
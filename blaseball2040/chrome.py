@@ -0,0 +1,53 @@
+import badger2040
+from badger_ui import App, Offset, Size, Widget
+
+from blaseball2040.framebuffer import restore_bands, save_bands
+
+# Chrome caches the top TITLE_BANDS bands of the frame, rows 0 to 31, which
+# hold a 30 pixel title bar, and below that the bands down to VALUE_BANDS,
+# rows 32 to 95, of as many columns from the left as the screen asks for.
+# That's where the bat and catch screens show the value they were given and
+# VS. Only one screen is shown at a time, so a single layer allocated at
+# import time is shared by every screen's chrome.
+TITLE_BANDS = 4
+VALUE_BANDS = 12
+_layer = bytearray(badger2040.WIDTH * VALUE_BANDS)
+_owner: 'Chrome | None' = None
+
+
+class Chrome(Widget):
+  """
+  A screen's static widgets, drawn once and then copied back from a cached
+  1-bit layer on every later render.
+
+  The layer holds the title bands across the screen and the value bands of
+  the first `width` columns, so the child must only draw within them, and
+  Chrome has to be the first thing a screen draws over a cleared frame.
+  Anything drawn after it goes on top, so the screen's live widgets may
+  share those columns. The layer is shared, so the last chrome to render
+  owns it. Call drop() when the screen is dismissed or bound to new values.
+  """
+
+  def __init__(self, child: Widget, width: int = 0):
+    self.child = child
+    self.width = width
+
+  def measure(self, app: 'App', size: Size) -> Size:
+    return size
+
+  def render(self, app: 'App', size: Size, offset: Offset):
+    global _owner
+    if _owner is self:
+      end = restore_bands(app.framebuffer, _layer, 0, badger2040.WIDTH, 0, TITLE_BANDS)
+      restore_bands(app.framebuffer, _layer, end, self.width, TITLE_BANDS, VALUE_BANDS)
+      return
+
+    self.child.render(app, size, offset)
+    end = save_bands(app.framebuffer, _layer, 0, badger2040.WIDTH, 0, TITLE_BANDS)
+    save_bands(app.framebuffer, _layer, end, self.width, TITLE_BANDS, VALUE_BANDS)
+    _owner = self
+
+  def drop(self):
+    global _owner
+    if _owner is self:
+      _owner = None
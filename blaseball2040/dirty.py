@@ -0,0 +1,24 @@
+from badger_ui import App
+
+
+class DirtyRect:
+  """
+  Tracks what a widget last drew and where. When either changes, the old and
+  new areas are cleared and added to the app's damage, so the app can push
+  just that region through a partial update.
+  """
+
+  def __init__(self):
+    self.state = None
+    self.rect: tuple[int, int, int, int] | None = None
+
+  def update(self, app: 'App', state, x: int, y: int, width: int, height: int):
+    rect = (x, y, width, height)
+    if self.state == state and self.rect == rect:
+      return
+
+    if self.rect is not None and self.rect != rect:
+      app.invalidate(*self.rect)
+    app.invalidate(*rect)
+    self.state = state
+    self.rect = rect
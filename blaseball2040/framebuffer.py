@@ -0,0 +1,89 @@
+import badger2040
+import micropython
+
+# The panel's framebuffer is column major: each x column is HEIGHT // 8 bytes,
+# one byte per band of 8 rows. Bands are also the panel's update granularity.
+BANDS = badger2040.HEIGHT // 8
+SIZE = badger2040.WIDTH * BANDS
+
+
+@micropython.native
+def diff_frames(old: bytearray, new: bytearray, x0: int, x1: int, bounds: list[int]) -> bool:
+  """
+  Compares columns x0 to x1 (exclusive) of two frames. If any byte differs,
+  fills bounds with the changed area as [x0, band0, x1, band1], both ends
+  exclusive, and returns True.
+  """
+  left = x1
+  right = x0
+  top = BANDS
+  bottom = 0
+  for x in range(x0, x1):
+    i = x * BANDS
+    for band in range(BANDS):
+      if old[i + band] != new[i + band]:
+        if x < left:
+          left = x
+        right = x + 1
+        if band < top:
+          top = band
+        if band >= bottom:
+          bottom = band + 1
+
+  if right <= left:
+    return False
+
+  bounds[0] = left
+  bounds[1] = top
+  bounds[2] = right
+  bounds[3] = bottom
+  return True
+
+
+@micropython.native
+def blit_bits(frame: bytearray, source, start: int, stride: int, width: int, height: int, x: int, y: int):
+  """
+  Sets the pixels of frame at x, y that are black in a row-major 1-bit image
+  at `start` in source, `stride` bytes a row. Only the first `width` columns
+  of each row are drawn, so the padding to whole bytes never covers what's
+  beside the image, and only what lands on the screen.
+  """
+  for row in range(height):
+    py = y + row
+    if py < 0 or py >= badger2040.HEIGHT:
+      continue
+    band = py >> 3
+    mask = 0x80 >> (py & 7)
+    i = start + row * stride
+    for col in range(0, width, 8):
+      bits = source[i + (col >> 3)]
+      if not bits:
+        continue
+      for bit in range(min(8, width - col)):
+        if bits & (0x80 >> bit):
+          px = x + col + bit
+          if 0 <= px < badger2040.WIDTH:
+            frame[px * BANDS + band] |= mask
+
+
+@micropython.native
+def save_bands(frame: bytearray, layer: bytearray, start: int, columns: int, top: int, bottom: int) -> int:
+  # Copies bands top to bottom of the first `columns` columns of frame into
+  # layer from `start`, packed a column at a time, and returns where they end
+  i = start
+  for column in range(0, columns * BANDS, BANDS):
+    for band in range(top, bottom):
+      layer[i] = frame[column + band]
+      i += 1
+  return i
+
+
+@micropython.native
+def restore_bands(frame: bytearray, layer: bytearray, start: int, columns: int, top: int, bottom: int) -> int:
+  # The reverse of save_bands()
+  i = start
+  for column in range(0, columns * BANDS, BANDS):
+    for band in range(top, bottom):
+      frame[column + band] = layer[i]
+      i += 1
+  return i
@@ -0,0 +1,227 @@
+"""
+The rules of the game, kept apart from the screens so they can run anywhere
+Python does, without badger2040.
+
+Every change to a game's count goes through Game.apply() with one of the
+`Event`s. The result depends only on the event, the inning and whether the
+balls, strikes and outs have reached their limits, so the transitions are
+worked out once into a table indexed by those. Each entry says what happens
+to each count and which `Screen` comes next.
+"""
+
+
+class Inning:
+  TOP = 0
+  BOTTOM = 1
+  OVER = 2
+
+
+class Screen:
+  STAT = 0
+  PITCH = 1
+  BAT = 2
+  ASK_CATCH = 3
+  CATCH = 4
+  RUNS = 5
+  BALL = 6
+  STRIKE = 7
+  OUT = 8
+  SCORE = 9
+
+
+class Event:
+  # Batting: the bat equals the pitch, is under it, or beats it
+  BALL = 0
+  STRIKE = 1
+  HIT = 2
+  # Fielding a hit
+  CAUGHT_OUT = 3
+  SAFE = 4
+  NO_CATCH = 5
+  # Runs scored after a hit
+  RUNS = 6
+  # Moving on from the ball, strike and out screens
+  BALL_SHOWN = 7
+  STRIKE_SHOWN = 8
+  OUT_SHOWN = 9
+  # The count raised by hand on the stat screen
+  BALLS_ADDED = 10
+  STRIKES_ADDED = 11
+  OUTS_ADDED = 12
+
+  COUNT = 13
+
+
+BALLS = 4
+STRIKES = 3
+OUTS = 3
+
+# What an event does to each count
+KEEP = 0
+ZERO = 1
+ADD = 2
+WRAP = 3
+
+
+def _transition(event: int, walk: bool, strikeout: bool, switch: bool, inning: int) -> tuple[int, int, int, int, int]:
+  # (next screen, balls, strikes, outs, inning)
+  if event == Event.BALL:
+    return Screen.BALL, ADD, KEEP, KEEP, KEEP
+  elif event == Event.STRIKE:
+    return Screen.STRIKE, KEEP, ADD, KEEP, KEEP
+  elif event == Event.HIT:
+    return Screen.ASK_CATCH, KEEP, KEEP, KEEP, KEEP
+  elif event == Event.CAUGHT_OUT:
+    return Screen.OUT, ZERO, KEEP, ADD, KEEP
+  elif event in (Event.SAFE, Event.NO_CATCH):
+    return Screen.RUNS, KEEP, KEEP, KEEP, KEEP
+  elif event == Event.RUNS:
+    return Screen.STAT, ZERO, ZERO, KEEP, KEEP
+  elif event == Event.BALL_SHOWN:
+    # The count wraps back round, so a walk doesn't go on to the runs screen
+    return Screen.STAT, WRAP, KEEP, KEEP, KEEP
+  elif event == Event.STRIKE_SHOWN:
+    if switch:
+      return Screen.OUT, KEEP, KEEP, KEEP, KEEP
+    elif strikeout:
+      return Screen.STAT, KEEP, ZERO, ADD, KEEP
+    return Screen.STAT, KEEP, KEEP, KEEP, KEEP
+  elif event == Event.OUT_SHOWN:
+    if switch and inning == Inning.BOTTOM:
+      return Screen.SCORE, ZERO, ZERO, ZERO, ADD
+    elif switch:
+      return Screen.STAT, ZERO, ZERO, ZERO, ADD
+    return Screen.STAT, KEEP, KEEP, KEEP, KEEP
+  elif event == Event.BALLS_ADDED:
+    return Screen.BALL if walk else Screen.STAT, KEEP, KEEP, KEEP, KEEP
+  elif event == Event.STRIKES_ADDED:
+    return Screen.STRIKE if strikeout else Screen.STAT, KEEP, KEEP, KEEP, KEEP
+  elif event == Event.OUTS_ADDED:
+    return Screen.OUT if switch else Screen.STAT, KEEP, KEEP, KEEP, KEEP
+  raise ValueError(f'unknown event {event}')
+
+
+def _key(walk: bool, strikeout: bool, switch: bool, inning: int) -> int:
+  return walk | strikeout << 1 | switch << 2 | inning << 3
+
+
+KEYS = 8 * 3
+
+
+def _table() -> list[tuple[int, int, int, int, int]]:
+  table = [None] * (Event.COUNT * KEYS)
+  for event in range(Event.COUNT):
+    for inning in (Inning.TOP, Inning.BOTTOM, Inning.OVER):
+      for flags in range(8):
+        walk, strikeout, switch = bool(flags & 1), bool(flags & 2), bool(flags & 4)
+        table[event * KEYS + _key(walk, strikeout, switch, inning)] = _transition(
+            event, walk, strikeout, switch, inning)
+  return table
+
+
+TRANSITIONS = _table()
+
+
+def _change(op: int, value: int, limit: int = 0) -> int:
+  if op == KEEP:
+    return value
+  elif op == ZERO:
+    return 0
+  elif op == ADD:
+    return value + 1
+  return value % limit
+
+
+def base(pitch: int, bat: int) -> int:
+  # 0 is a ball, below 0 a strike, 4 and over a homerun
+  return bat - pitch
+
+
+def out(bat: int, catch: int) -> bool:
+  return bat - catch < 0
+
+
+class Game:
+  def __init__(
+      self,
+      team1: str,
+      team2: str,
+      inning: int = Inning.TOP,
+      score1: int = 0,
+      score2: int = 0,
+      outs: int = 0,
+      strikes: int = 0,
+      balls: int = 0,
+  ):
+    self.team1 = team1
+    self.team2 = team2
+    self.inning = inning
+    self.score1 = score1
+    self.score2 = score2
+    self.outs = outs
+    self.strikes = strikes
+    self.balls = balls
+
+  @property
+  def walk(self) -> bool:
+    return self.balls >= BALLS
+
+  @property
+  def strikeout(self) -> bool:
+    return self.strikes >= STRIKES
+
+  @property
+  def switch(self) -> bool:
+    return self.outs >= OUTS
+
+  @property
+  def over(self) -> bool:
+    return self.switch and self.inning == Inning.BOTTOM
+
+  def apply(self, event: int) -> int:
+    screen, balls, strikes, outs, inning = TRANSITIONS[
+        event * KEYS + _key(self.walk, self.strikeout, self.switch, min(self.inning, Inning.OVER))]
+    self.balls = _change(balls, self.balls, BALLS)
+    self.strikes = _change(strikes, self.strikes, STRIKES)
+    self.outs = _change(outs, self.outs, OUTS)
+    self.inning = _change(inning, self.inning)
+    return screen
+
+  def next_pitch(self) -> int:
+    return Screen.PITCH
+
+  def pitched(self, pitch: int) -> int:
+    return Screen.BAT
+
+  def batted(self, pitch: int, bat: int) -> int:
+    value = base(pitch, bat)
+    if value == 0:
+      return self.apply(Event.BALL)
+    elif value < 0:
+      return self.apply(Event.STRIKE)
+    return self.apply(Event.HIT)
+
+  def fielded(self, catch: bool) -> int:
+    return Screen.CATCH if catch else self.apply(Event.NO_CATCH)
+
+  def caught(self, bat: int, catch: int) -> int:
+    return self.apply(Event.CAUGHT_OUT if out(bat, catch) else Event.SAFE)
+
+  def scored(self, runs: int) -> int:
+    if self.inning == Inning.TOP:
+      self.score1 += runs
+    elif self.inning == Inning.BOTTOM:
+      self.score2 += runs
+    return self.apply(Event.RUNS)
+
+  def add_balls(self, amount: int) -> int:
+    self.balls = max(self.balls + amount, 0)
+    return self.apply(Event.BALLS_ADDED) if amount > 0 else Screen.STAT
+
+  def add_strikes(self, amount: int) -> int:
+    self.strikes = max(self.strikes + amount, 0)
+    return self.apply(Event.STRIKES_ADDED) if amount > 0 else Screen.STAT
+
+  def add_outs(self, amount: int) -> int:
+    self.outs = max(self.outs + amount, 0)
+    return self.apply(Event.OUTS_ADDED) if amount > 0 else Screen.STAT
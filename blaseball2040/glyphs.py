@@ -0,0 +1,9 @@
+# Code generated by image_converter.py.
+
+ATLAS = 'glyphs.bin'
+
+# line height: (characters, widths, offsets into ATLAS)
+SIZES = {
+    30: (' ?ABCHINPRSTUV', (16, 18, 18, 21, 21, 22, 8, 22, 21, 21, 20, 16, 22, 18), (3000, 3060, 3150, 3240, 3330, 3420, 3510, 3540, 3630, 3720, 3810, 3900, 3960, 4050)),
+    60: ('0123456789', (40, 40, 40, 40, 40, 40, 40, 40, 40, 40), (0, 300, 600, 900, 1200, 1500, 1800, 2100, 2400, 2700)),
+}
@@ -0,0 +1,183 @@
+import badger2040
+from badger_ui import App, Offset, Size, Widget
+
+from blaseball2040.assets import AssetHandle, exists, open_asset, path, registry
+from blaseball2040.framebuffer import blit_bits
+
+# One strip buffer shared by every image. Draws never overlap, and a single
+# allocation made at import time can't be starved by heap fragmentation.
+# 296 bytes holds 8 full-width rows of the display.
+_strip = bytearray(badger2040.WIDTH // 8 * 8)
+
+
+def _strip_rows(stride: int) -> int:
+  return max(len(_strip) // stride, 1)
+
+
+def _unpack(f, strip: memoryview, end: int):
+  # Expand PackBits runs from f until strip[:end] is filled
+  header = bytearray(1)
+  i = 0
+  while i < end:
+    f.readinto(header)
+    count = header[0]
+    if count < 128:
+      count += 1
+      f.readinto(strip[i:i + count])
+      i += count
+    elif count > 128:
+      count = 257 - count
+      f.readinto(header)
+      value = header[0]
+      for j in range(i, i + count):
+        strip[j] = value
+      i += count
+
+
+class Asset:
+  """
+  Holds a registry handle to the named asset from its first draw until
+  release(), so the asset stays cached while its screen is shown.
+  """
+
+  def __init__(self, name: str):
+    self.name = name
+    self.handle: AssetHandle | None = None
+
+  def asset(self) -> AssetHandle:
+    if self.handle is None:
+      self.handle = registry.acquire(self.name)
+    return self.handle
+
+  def release(self):
+    if self.handle is not None:
+      self.handle.release()
+      self.handle = None
+
+
+class StripIconSheet(Asset):
+  """
+  An icon sheet (`image_converter.py --sheet`). Frozen or cached sheets are
+  drawn straight from their memoryview, otherwise only the rows of the
+  requested icon are read from the file, a strip at a time.
+  """
+
+  def __init__(self, name: str, size: int, count: int):
+    super().__init__(name)
+    self.size = size
+    self.count = count
+
+  def icon(self, display: badger2040.Badger2040, icon_index: int, offset: Offset):
+    data = self.asset().data()
+    if data is not None:
+      display.icon(data, icon_index, self.size * self.count, self.size, offset.x, offset.y)
+      return
+
+    stride = self.size // 8
+    sheet_stride = stride * self.count
+    rows = _strip_rows(stride)
+    strip = memoryview(_strip)
+
+    with open(path(self.name), 'rb') as f:
+      for y in range(0, self.size, rows):
+        n = min(rows, self.size - y)
+        for row in range(n):
+          f.seek((y + row) * sheet_stride + icon_index * stride)
+          f.readinto(strip[row * stride:(row + 1) * stride])
+        display.image(strip, self.size, n, offset.x, offset.y + y)
+
+
+class RLEImage:
+  """
+  A 1-bit image stored as PackBits-compressed rows, as written by
+  `image_converter.py --rle`.
+
+  Rows are decoded into the shared strip buffer and drawn a strip at a time,
+  so the decompressed frame is never held in memory. Unless frozen, the
+  compressed art is streamed from its file too rather than cached, as it's
+  drawn once per visit.
+  """
+
+  def __init__(self, name: str, width: int, height: int):
+    self.name = name
+    self.width = width
+    self.height = height
+
+  def draw(self, display: badger2040.Badger2040, offset: Offset):
+    stride = (self.width + 7) // 8
+    rows = _strip_rows(stride)
+    strip = memoryview(_strip)
+
+    with open_asset(self.name) as f:
+      for y in range(0, self.height, rows):
+        n = min(rows, self.height - y)
+        _unpack(f, strip, n * stride)
+        display.image(strip, self.width, n, offset.x, offset.y + y)
+
+
+class DeltaImage:
+  """
+  The changed byte spans between two full-screen images, as written by
+  `image_converter.py --delta`. Drawn over a panel that already shows the
+  source image, it leaves the target image there.
+  """
+
+  def __init__(self, name: str):
+    self.name = name
+
+  def draw(self, display: badger2040.Badger2040, offset: Offset):
+    strip = memoryview(_strip)
+    header = bytearray(4)
+    record = memoryview(header)[:3]
+
+    with open_asset(self.name) as f:
+      # Skip the bounds header, the app diffs the frame itself
+      f.readinto(header)
+
+      while f.readinto(record) == 3:
+        row, col, length = record
+        _unpack(f, strip, length)
+        display.image(strip, length * 8, 1, offset.x + col * 8, offset.y + row)
+
+
+def find_delta(source: str, target: str) -> DeltaImage | None:
+  name = f'{source.split(".")[0]}_to_{target.split(".")[0]}.delta'
+  if exists(name):
+    return DeltaImage(name)
+  return None
+
+
+class BackgroundWidget(Widget):
+  """
+  Draws a screen's full-screen art, unless the app already put it on the
+  panel with a delta from the previous screen's art.
+  """
+
+  def __init__(self, image: RLEImage):
+    self.image = image
+
+  def measure(self, app: 'App', size: Size) -> Size:
+    return Size(self.image.width, self.image.height)
+
+  def render(self, app: 'App', size: Size, offset: Offset):
+    if app.backdrop == self.image.name:
+      return
+    self.image.draw(app.display, offset)
+
+
+def blit(frame: bytearray, source, start: int, width: int, height: int, x: int, y: int):
+  # Draws the image at `start` in a packed atlas, from a memoryview
+  # directly or from an open file through the strip buffer, clipped to its
+  # `width` so its padding leaves the pixels to its right alone.
+  stride = (width + 7) // 8
+  if isinstance(source, memoryview):
+    blit_bits(frame, source, start, stride, width, height, x, y)
+    return
+
+  rows = _strip_rows(stride)
+  strip = memoryview(_strip)
+  source.seek(start)
+  for row in range(0, height, rows):
+    n = min(rows, height - row)
+    source.readinto(strip[:n * stride])
+    blit_bits(frame, strip, 0, stride, width, n, x, y + row)
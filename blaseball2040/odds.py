@@ -0,0 +1,16 @@
+# Code generated by odds_table.py.
+# catch uniform:0:20, catch rate 0.5
+
+TABLE = 'odds.bin'
+VALUES = 41
+COUNT = 7
+NAMES = ('strike', 'ball', 'base 1', 'base 2', 'base 3', 'homerun', 'out')
+LABELS = ('K', 'B', '1B', '2B', '3B', 'HR', 'O')
+
+STRIKE = 0
+BALL = 1
+BASE_1 = 2
+BASE_2 = 3
+BASE_3 = 4
+HOMERUN = 5
+OUT = 6
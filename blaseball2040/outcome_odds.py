@@ -0,0 +1,104 @@
+from badger_ui import App, Offset, Size, Widget
+from badger_ui.text import TextWidget
+
+from blaseball2040 import odds
+from blaseball2040.assets import path
+from blaseball2040.image import Asset
+
+# The table is small and the bat screen looks it up on every change, so it's
+# held from the first lookup on
+_table = Asset(odds.TABLE)
+_byte = bytearray(1)
+
+# Every percentage as text, made once so showing the odds formats nothing
+PERCENT = tuple(f'{percent}' for percent in range(101))
+
+LINE_HEIGHT = 12
+SCALE = 0.35
+LABEL_WIDTH = 18
+VALUE_WIDTH = 20
+
+
+def caught(bat: int) -> int:
+  """
+  The percentage chance that a hit with `bat` is caught out, from the table
+  made by `odds_table.py`. Values past the last entry share it.
+  """
+  index = min(bat, odds.VALUES - 1)
+  data = _table.asset().data()
+  if data is not None:
+    return data[index]
+
+  with open(path(odds.TABLE), 'rb') as f:
+    f.seek(index)
+    f.readinto(_byte)
+  return _byte[0]
+
+
+def outcome(base: int) -> int:
+  # The outcome of a game.base() value, unless the hit is caught
+  if base < 0:
+    return odds.STRIKE
+  elif base == 0:
+    return odds.BALL
+  return odds.BASE_1 + min(base, 4) - 1
+
+
+def _rows(app: 'App', texts: list[TextWidget], size: Size, offset: Offset):
+  for outcome in range(odds.COUNT):
+    texts[outcome].render(app, Size(size.width, LINE_HEIGHT), Offset(offset.x, offset.y + outcome * LINE_HEIGHT))
+
+
+class OddsLabels(Widget):
+  """
+  The name of each outcome, one per row beside OutcomeOdds.
+  """
+
+  def __init__(self):
+    self.texts = [
+        TextWidget(
+            text=label,
+            line_height=LINE_HEIGHT,
+            scale=SCALE,
+        )
+        for label in odds.LABELS
+    ]
+
+  def measure(self, app: 'App', size: Size) -> Size:
+    return Size(LABEL_WIDTH, LINE_HEIGHT * odds.COUNT)
+
+  def render(self, app: 'App', size: Size, offset: Offset):
+    _rows(app, self.texts, size, offset)
+
+
+class OutcomeOdds(Widget):
+  """
+  The percentage chance of each outcome, one per row, given what the screen
+  already knows: `outcome` happens unless the hit is caught out, which has
+  a `caught` percent chance.
+  """
+
+  def __init__(self, outcome: int, caught: int):
+    self.outcome = outcome
+    self.caught = caught
+    self.texts = [
+        TextWidget(
+            text='',
+            line_height=LINE_HEIGHT,
+            scale=SCALE,
+        )
+        for _ in range(odds.COUNT)
+    ]
+
+  def measure(self, app: 'App', size: Size) -> Size:
+    return Size(VALUE_WIDTH, LINE_HEIGHT * odds.COUNT)
+
+  def render(self, app: 'App', size: Size, offset: Offset):
+    for row in range(odds.COUNT):
+      percent = 0
+      if row == odds.OUT:
+        percent = self.caught
+      if row == self.outcome:
+        percent += 100 - self.caught
+      self.texts[row].text = PERCENT[percent]
+    _rows(app, self.texts, size, offset)
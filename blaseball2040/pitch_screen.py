@@ -8,29 +8,42 @@ from badger_ui.sized import SizedBox
 from badger_ui.stack import Stack
 from badger_ui.text import TextWidget
 
+from blaseball2040.bitmap_text import BitmapText
+from blaseball2040.chrome import Chrome
+from blaseball2040.game import Event, Game, Screen, base, out
+from blaseball2040.outcome_odds import LABEL_WIDTH, LINE_HEIGHT, SCALE, VALUE_WIDTH, OddsLabels, OutcomeOdds, caught, outcome
 from blaseball2040.score_screen import ScoreScreen
-from blaseball2040.stat_screen import Game, Inning, StatScreen
+from blaseball2040.stat_screen import StatScreen
 
 
 class PitchScreen(Widget):
   def __init__(self, game: Game) -> None:
+    self.pitch_text: BitmapText | None = None
+    self.chrome: Chrome | None = None
+    self.child: Widget | None = None
+    self.bind(game)
+
+  def bind(self, game: Game):
     self.game = game
     self.pitch = 10
+    if self.chrome:
+      self.chrome.drop()
 
-    self.pitch_text: TextWidget | None = None
-    self.child: Widget | None = None
+  def dismiss(self, app: 'App'):
+    if self.chrome:
+      self.chrome.drop()
 
   def on_button(self, app: 'App', pressed: dict[int, bool]) -> bool:
     if pressed[badger2040.BUTTON_UP]:
-      self.pitch += 1
+      self.pitch += pressed[badger2040.BUTTON_UP]
       return True
 
     elif pressed[badger2040.BUTTON_DOWN]:
-      self.pitch = max(self.pitch - 1, 0)
+      self.pitch = max(self.pitch - pressed[badger2040.BUTTON_DOWN], 0)
       return True
 
     elif pressed[badger2040.BUTTON_B]:
-      app.child = BatScreen(self.game, self.pitch)
+      show(app, self.game.pitched(self.pitch), self.game, self.pitch)
       return True
 
     return super().on_button(app, pressed)
@@ -40,24 +53,22 @@ class PitchScreen(Widget):
     if self.pitch_text:
       self.pitch_text.text = pitch
     else:
-      self.pitch_text = TextWidget(
+      self.pitch_text = BitmapText(
           text=pitch,
           line_height=60,
-          thickness=2,
-          scale=2,
       )
 
     if self.child:
       return
+    self.chrome = Chrome(child=SizedBox(
+        child=Center(child=BitmapText(
+            text='PITCH',
+            line_height=30,
+        )),
+        size=Size(size.width, 30),
+    ))
     self.child = Stack(children=[
-        SizedBox(
-            child=Center(child=TextWidget(
-                text='PITCH',
-                line_height=30,
-                thickness=2,
-            )),
-            size=Size(size.width, 30),
-        ),
+        self.chrome,
         Center(child=self.pitch_text),
     ])
 
@@ -68,62 +79,64 @@ class PitchScreen(Widget):
 
 class BatScreen(Widget):
   def __init__(self, game: Game, pitch: int) -> None:
+    self.pitch_text: BitmapText | None = None
+    self.bat_text: BitmapText | None = None
+    self.subtitle: TextWidget | None = None
+    self.odds: OutcomeOdds | None = None
+    self.chrome: Chrome | None = None
+    self.child: Widget | None = None
+    self.bind(game, pitch)
+
+  def bind(self, game: Game, pitch: int):
     self.game = game
     self.pitch = pitch
     self.bat = 10
+    if self.chrome:
+      self.chrome.drop()
 
-    self.bat_text: TextWidget | None = None
-    self.subtitle: TextWidget | None = None
-    self.child: Widget | None = None
+  def dismiss(self, app: 'App'):
+    if self.chrome:
+      self.chrome.drop()
 
   @property
   def base(self):
-    return self.bat - self.pitch
-
-  @property
-  def strike(self):
-    return self.base < 0
-
-  @property
-  def ball(self):
-    return self.base == 0
+    return base(self.pitch, self.bat)
 
   def on_button(self, app: 'App', pressed: dict[int, bool]) -> bool:
     if pressed[badger2040.BUTTON_UP]:
-      self.bat += 1
+      self.bat += pressed[badger2040.BUTTON_UP]
       return True
 
     elif pressed[badger2040.BUTTON_DOWN]:
-      self.bat = max(self.bat - 1, 0)
+      self.bat = max(self.bat - pressed[badger2040.BUTTON_DOWN], 0)
       return True
 
     elif pressed[badger2040.BUTTON_B]:
-      if self.ball:
-        self.game.balls += 1
-        app.child = BallScreen(self.game)
-      elif self.strike:
-        self.game.strikes += 1
-        app.child = StrikeScreen(self.game)
-      else:
-        app.child = AskCatchScreen(self.game, self.pitch, self.bat)
+      show(app, self.game.batted(self.pitch, self.bat), self.game, self.pitch, self.bat)
       return True
 
     return super().on_button(app, pressed)
 
   def build(self, app: 'App', size: Size, offset: Offset):
+    if self.pitch_text:
+      self.pitch_text.text = f'{self.pitch}'
+    else:
+      self.pitch_text = BitmapText(
+          text=f'{self.pitch}',
+          line_height=60,
+      )
+
     if self.bat_text:
       self.bat_text.text = f'{self.bat}'
     else:
-      self.bat_text = TextWidget(
+      self.bat_text = BitmapText(
           text=f'{self.bat}',
           line_height=60,
-          thickness=2,
-          scale=2,
       )
 
-    if self.strike:
+    if self.base < 0:
       subtitle = 'Strike!'
-    elif self.ball:
+    elif self.base == 0:
       subtitle = 'Ball!'
     elif self.base >= 4:
       subtitle = 'Homerun!'
@@ -139,34 +152,61 @@ class BatScreen(Widget):
           thickness=2,
       )
 
+    # The pitch and bat settle the base, only the catch is still to come
+    result = outcome(self.base)
+    chance = caught(self.bat) if self.base > 0 else 0
+    if self.odds:
+      self.odds.outcome = result
+      self.odds.caught = chance
+    else:
+      self.odds = OutcomeOdds(result, chance)
+
     if self.child:
       return
+    # The values and VS share what's left of the odds column, so a value
+    # as wide as 100 stops short of it
+    odds_x = size.width - LABEL_WIDTH - VALUE_WIDTH
+    versus = BitmapText(
+        text='VS',
+        line_height=30,
+    )
+    versus_width = versus.measure(app, size).width
+    # The pitch is fixed until the screen is bound again, so the chrome
+    # keeps it along with the title and VS, up to VS's right-hand edge
+    self.chrome = Chrome(
+        child=Stack(children=[
+            SizedBox(
+                child=Center(child=BitmapText(
+                    text='BAT',
+                    line_height=30,
+                )),
+                size=Size(size.width, 30),
+            ),
+            SizedBox(
+                child=Stack(children=[
+                    Positioned(
+                        child=Center(child=self.pitch_text),
+                        offset=Offset(-(odds_x // 4), 0),
+                    ),
+                    Center(child=versus),
+                ]),
+                size=Size(odds_x, size.height),
+            ),
+        ]),
+        width=(odds_x - versus_width) // 2 + versus_width,
+    )
     self.child = Stack(children=[
+        self.chrome,
         SizedBox(
-            child=Center(child=TextWidget(
-                text='BAT',
-                line_height=30,
-                thickness=2,
-            )),
-            size=Size(size.width, 30),
-        ),
-        Positioned(
-            child=Center(child=TextWidget(
-                text=f'{self.pitch}',
-                line_height=60,
-                thickness=2,
-                scale=2,
-            )),
-            offset=Offset(-(size.width // 4), 0),
+            child=Positioned(
+                child=Center(child=self.bat_text),
+                offset=Offset(odds_x // 4, 0),
+            ),
+            size=Size(odds_x, size.height),
         ),
-        Center(child=TextWidget(
-            text='VS',
-            line_height=30,
-            thickness=2,
-        )),
         Positioned(
-            child=Center(child=self.bat_text),
-            offset=Offset(size.width // 4, 0),
+            child=OddsLabels(),
+            offset=Offset(odds_x, 34),
         ),
         SizedBox(
             child=Positioned(
@@ -175,6 +215,10 @@ class BatScreen(Widget):
             ),
             size=Size(size.width, 30),
         ),
+        Positioned(
+            child=self.odds,
+            offset=Offset(size.width - VALUE_WIDTH, 34),
+        ),
     ])
 
   def render(self, app: 'App', size: Size, offset: Offset):
@@ -184,14 +228,23 @@ class BatScreen(Widget):
 
 class AskCatchScreen(Widget):
   def __init__(self, game: Game, pitch: int, bat: int) -> None:
+    self.yes_text: TextWidget | None = None
+    self.no_text: TextWidget | None = None
+    self.chrome: Chrome | None = None
+    self.child: Widget | None = None
+    self.bind(game, pitch, bat)
+
+  def bind(self, game: Game, pitch: int, bat: int):
     self.game = game
     self.pitch = pitch
     self.bat = bat
     self.catch = True
+    if self.chrome:
+      self.chrome.drop()
 
-    self.yes_text: TextWidget | None = None
-    self.no_text: TextWidget | None = None
-    self.child: Widget | None = None
+  def dismiss(self, app: 'App'):
+    if self.chrome:
+      self.chrome.drop()
 
   def on_button(self, app: 'App', pressed: dict[int, bool]) -> bool:
     if pressed[badger2040.BUTTON_A]:
@@ -199,10 +252,8 @@ class AskCatchScreen(Widget):
       return True
 
     elif pressed[badger2040.BUTTON_B]:
-      if self.catch:
-        app.child = CatchScreen(self.game, self.pitch, self.bat + 1)
-      else:
-        app.child = RunsScreen(self.game)
+      # The catch is made against the bat + 1
+      show(app, self.game.fielded(self.catch), self.game, self.pitch, self.bat + 1)
       return True
 
     elif pressed[badger2040.BUTTON_C]:
@@ -236,15 +287,15 @@ class AskCatchScreen(Widget):
 
     if self.child:
       return
+    self.chrome = Chrome(child=SizedBox(
+        child=Center(child=BitmapText(
+            text='CATCH?',
+            line_height=30,
+        )),
+        size=Size(size.width, 30),
+    ))
     self.child = Stack(children=[
-        SizedBox(
-            child=Center(child=TextWidget(
-                text='CATCH?',
-                line_height=30,
-                thickness=2,
-            )),
-            size=Size(size.width, 30),
-        ),
+        self.chrome,
         Center(child=Row(children=[
             SizedBox(
                 child=Center(child=self.yes_text),
@@ -264,53 +315,65 @@ class AskCatchScreen(Widget):
 
 class CatchScreen(Widget):
   def __init__(self, game: Game, pitch: int, bat: int) -> None:
+    self.bat_text: BitmapText | None = None
+    self.catch_text: BitmapText | None = None
+    self.subtitle: TextWidget | None = None
+    self.odds: OutcomeOdds | None = None
+    self.chrome: Chrome | None = None
+    self.child: Widget | None = None
+    self.bind(game, pitch, bat)
+
+  def bind(self, game: Game, pitch: int, bat: int):
     self.game = game
     self.pitch = pitch
     self.bat = bat
     self.catch = 10
+    if self.chrome:
+      self.chrome.drop()
 
-    self.catch_text: TextWidget | None = None
-    self.subtitle: TextWidget | None = None
-    self.child: Widget | None = None
+  def dismiss(self, app: 'App'):
+    if self.chrome:
+      self.chrome.drop()
 
   @property
   def base(self):
-    return self.bat - self.pitch
+    return base(self.pitch, self.bat)
 
   @property
   def out(self):
-    return self.bat - self.catch < 0
+    return out(self.bat, self.catch)
 
   def on_button(self, app: 'App', pressed: dict[int, bool]) -> bool:
     if pressed[badger2040.BUTTON_UP]:
-      self.catch += 1
+      self.catch += pressed[badger2040.BUTTON_UP]
       return True
 
     elif pressed[badger2040.BUTTON_DOWN]:
-      self.catch = max(self.catch - 1, 0)
+      self.catch = max(self.catch - pressed[badger2040.BUTTON_DOWN], 0)
       return True
 
     elif pressed[badger2040.BUTTON_B]:
-      if self.out:
-        self.game.outs += 1
-        self.game.balls = 0
-        app.child = OutScreen(self.game)
-      else:
-        app.child = RunsScreen(self.game)
+      show(app, self.game.caught(self.bat, self.catch), self.game)
       return True
 
     return super().on_button(app, pressed)
 
   def build(self, app: 'App', size: Size, offset: Offset):
+    if self.bat_text:
+      self.bat_text.text = f'{self.bat}'
+    else:
+      self.bat_text = BitmapText(
+          text=f'{self.bat}',
+          line_height=60,
+      )
+
     catch = f'{self.catch}'
     if self.catch_text:
       self.catch_text.text = catch
     else:
-      self.catch_text = TextWidget(
+      self.catch_text = BitmapText(
           text=catch,
           line_height=60,
-          thickness=2,
-          scale=2,
       )
 
     if self.out:
@@ -329,39 +392,62 @@ class CatchScreen(Widget):
           thickness=2,
       )
 
+    # The odds as they stood before the catch, under a 'Prior' heading, since
+    # the subtitle already says how it turned out
+    result = outcome(self.base)
+    chance = caught(self.bat) if self.base > 0 else 0
+    if self.odds:
+      self.odds.outcome = result
+      self.odds.caught = chance
+    else:
+      self.odds = OutcomeOdds(result, chance)
+
     if self.child:
       return
+    # The values and VS share what's left of the odds column, so a value
+    # as wide as 100 stops short of it
+    odds_x = size.width - LABEL_WIDTH - VALUE_WIDTH
+    versus = BitmapText(
+        text='VS',
+        line_height=30,
+    )
+    versus_width = versus.measure(app, size).width
+    # The bat is fixed until the screen is bound again, so the chrome
+    # keeps it along with the title and VS, up to VS's right-hand edge
+    self.chrome = Chrome(
+        child=Stack(children=[
+            SizedBox(
+                child=Center(child=BitmapText(
+                    text='CATCH',
+                    line_height=30,
+                )),
+                size=Size(size.width, 30),
+            ),
+            SizedBox(
+                child=Stack(children=[
+                    Positioned(
+                        child=Center(child=self.bat_text),
+                        offset=Offset(-(odds_x // 4), 0),
+                    ),
+                    Center(child=versus),
+                ]),
+                size=Size(odds_x, size.height),
+            ),
+        ]),
+        width=(odds_x - versus_width) // 2 + versus_width,
+    )
     self.child = Stack(children=[
+        self.chrome,
         SizedBox(
-            child=Center(child=TextWidget(
-                text='CATCH',
-                line_height=30,
-                thickness=2,
-            )),
-            size=Size(size.width, 30),
-        ),
-        Positioned(
-            child=Center(child=TextWidget(
-                text=f'{self.bat}',
-                line_height=60,
-                thickness=2,
-                scale=2,
-            )),
-            offset=Offset(-(size.width // 4), 0),
+            child=Positioned(
+                child=Center(child=self.catch_text),
+                offset=Offset(odds_x // 4, 0),
+            ),
+            size=Size(odds_x, size.height),
         ),
-        Center(child=TextWidget(
-            text='VS',
-            line_height=30,
-            thickness=2,
-        )),
         Positioned(
-            child=Center(child=TextWidget(
-                text=f'{self.bat}',
-                line_height=60,
-                thickness=2,
-                scale=2,
-            )),
-            offset=Offset(size.width // 4, 0),
+            child=OddsLabels(),
+            offset=Offset(odds_x, 34),
         ),
         SizedBox(
             child=Positioned(
@@ -370,6 +456,10 @@ class CatchScreen(Widget):
             ),
             size=Size(size.width, 30),
         ),
+        Positioned(
+            child=self.odds,
+            offset=Offset(size.width - VALUE_WIDTH, 34),
+        ),
     ])
 
   def render(self, app: 'App', size: Size, offset: Offset):
@@ -379,20 +469,16 @@ class CatchScreen(Widget):
 
 class BallScreen(Widget):
   def __init__(self, game: Game) -> None:
+    self.bind(game)
+
+  def bind(self, game: Game):
     self.game = game
+    # Which message is shown depends on the game, so rebuild rather than update
     self.child: Widget | None = None
 
-  @property
-  def walk(self):
-    return self.game.balls >= 4
-
   def on_button(self, app: 'App', pressed: dict[int, bool]) -> bool:
     if pressed[badger2040.BUTTON_B]:
-      self.game.balls %= 4
-      if self.walk:
-        app.child = RunsScreen(self.game)
-      else:
-        app.child = StatScreen(self.game)
+      show(app, self.game.apply(Event.BALL_SHOWN), self.game)
       return True
 
     return super().on_button(app, pressed)
@@ -401,7 +487,7 @@ class BallScreen(Widget):
     if self.child:
       return
 
-    if self.walk:
+    if self.game.walk:
       self.child = Center(child=Column(children=[
           TextWidget(
               text='Walk!',
@@ -430,27 +516,16 @@ class BallScreen(Widget):
 
 class StrikeScreen(Widget):
   def __init__(self, game: Game) -> None:
+    self.bind(game)
+
+  def bind(self, game: Game):
     self.game = game
+    # Which message is shown depends on the game, so rebuild rather than update
     self.child: Widget | None = None
 
-  @property
-  def switch(self):
-    return self.game.outs >= 3
-
-  @property
-  def out(self):
-    return self.game.strikes >= 3
-
   def on_button(self, app: 'App', pressed: dict[int, bool]) -> bool:
     if pressed[badger2040.BUTTON_B]:
-      if self.switch:
-        app.child = OutScreen(self.game)
-      elif self.out:
-        self.game.outs += 1
-        self.game.strikes = 0
-        app.child = StatScreen(self.game)
-      else:
-        app.child = StatScreen(self.game)
+      show(app, self.game.apply(Event.STRIKE_SHOWN), self.game)
       return True
 
     return super().on_button(app, pressed)
@@ -459,7 +534,7 @@ class StrikeScreen(Widget):
     if self.child:
       return
 
-    if self.out:
+    if self.game.strikeout:
       self.child = Center(child=Column(children=[
           TextWidget(
               text='Out!',
@@ -488,33 +563,16 @@ class StrikeScreen(Widget):
 
 class OutScreen(Widget):
   def __init__(self, game: Game) -> None:
+    self.bind(game)
+
+  def bind(self, game: Game):
     self.game = game
+    # Which message is shown depends on the game, so rebuild rather than update
     self.child: Widget | None = None
 
-  @property
-  def switch(self):
-    return self.game.outs >= 3
-
-  @property
-  def over(self):
-    return self.switch and self.game.inning == Inning.BOTTOM
-
   def on_button(self, app: 'App', pressed: dict[int, bool]) -> bool:
     if pressed[badger2040.BUTTON_B]:
-      if self.over:
-        self.game.inning += 1
-        self.game.outs = 0
-        self.game.strikes = 0
-        self.game.balls = 0
-        app.child = ScoreScreen(self.game)
-      elif self.switch:
-        self.game.inning += 1
-        self.game.outs = 0
-        self.game.strikes = 0
-        self.game.balls = 0
-        app.child = StatScreen(self.game)
-      else:
-        app.child = StatScreen(self.game)
+      show(app, self.game.apply(Event.OUT_SHOWN), self.game)
       return True
 
     return super().on_button(app, pressed)
@@ -523,7 +581,7 @@ class OutScreen(Widget):
     if self.child:
       return
 
-    if self.over:
+    if self.game.over:
       self.child = Center(child=Column(children=[
           TextWidget(
               text='Game Over!',
@@ -537,7 +595,7 @@ class OutScreen(Widget):
               thickness=2,
           ),
       ]))
-    elif self.switch:
+    elif self.game.switch:
       self.child = Center(child=Column(children=[
           TextWidget(
               text='Switch!',
@@ -566,28 +624,32 @@ class OutScreen(Widget):
 
 class RunsScreen(Widget):
   def __init__(self, game: Game) -> None:
+    self.child: Widget | None = None
+    self.runs_text: BitmapText | None = None
+    self.chrome: Chrome | None = None
+    self.bind(game)
+
+  def bind(self, game: Game):
     self.game = game
     self.runs = 0
-    self.child: Widget | None = None
-    self.runs_text: TextWidget | None = None
+    if self.chrome:
+      self.chrome.drop()
+
+  def dismiss(self, app: 'App'):
+    if self.chrome:
+      self.chrome.drop()
 
   def on_button(self, app: 'App', pressed: dict[int, bool]) -> bool:
     if pressed[badger2040.BUTTON_B]:
-      if self.game.inning == Inning.TOP:
-        self.game.score1 += self.runs
-      elif self.game.inning == Inning.BOTTOM:
-        self.game.score2 += self.runs
-      self.game.strikes = 0
-      self.game.balls = 0
-      app.child = StatScreen(self.game)
+      show(app, self.game.scored(self.runs), self.game)
       return True
 
     elif pressed[badger2040.BUTTON_UP]:
-      self.runs += 1
+      self.runs += pressed[badger2040.BUTTON_UP]
       return True
 
     elif pressed[badger2040.BUTTON_DOWN]:
-      self.runs = max(self.runs - 1, 0)
+      self.runs = max(self.runs - pressed[badger2040.BUTTON_DOWN], 0)
       return True
 
     return super().on_button(app, pressed)
@@ -596,28 +658,53 @@ class RunsScreen(Widget):
     if self.runs_text:
       self.runs_text.text = f'{self.runs}'
     else:
-      self.runs_text = TextWidget(
+      self.runs_text = BitmapText(
           text=f'{self.runs}',
           line_height=60,
-          thickness=2,
-          scale=2,
       )
 
     if self.child:
       return
 
+    self.chrome = Chrome(child=SizedBox(
+        child=Center(child=BitmapText(
+            text='RUNS',
+            line_height=30,
+        )),
+        size=Size(size.width, 30),
+    ))
     self.child = Stack(children=[
-        SizedBox(
-            child=Center(child=TextWidget(
-                text='RUNS',
-                line_height=30,
-                thickness=2,
-            )),
-            size=Size(size.width, 30),
-        ),
+        self.chrome,
         Center(child=self.runs_text),
     ])
 
   def render(self, app: 'App', size: Size, offset: Offset):
     self.build(app, size, offset)
     self.child.render(app, size, offset)
+
+
+# The view for each of the game's screens
+VIEWS = {
+    Screen.STAT: StatScreen,
+    Screen.PITCH: PitchScreen,
+    Screen.BAT: BatScreen,
+    Screen.ASK_CATCH: AskCatchScreen,
+    Screen.CATCH: CatchScreen,
+    Screen.RUNS: RunsScreen,
+    Screen.BALL: BallScreen,
+    Screen.STRIKE: StrikeScreen,
+    Screen.OUT: OutScreen,
+    Screen.SCORE: ScoreScreen,
+}
+
+
+def show(app: 'App', screen: int, game: Game, pitch: int = 0, bat: int = 0):
+  # Moves the app to the game's next screen. Only the bat, catch? and catch
+  # screens take the pitch and bat values.
+  view = VIEWS[screen]
+  if screen == Screen.BAT:
+    app.child = app.screens.get(view, game, pitch)
+  elif screen in (Screen.ASK_CATCH, Screen.CATCH):
+    app.child = app.screens.get(view, game, pitch, bat)
+  else:
+    app.child = app.screens.get(view, game)
@@ -0,0 +1,52 @@
+import badger2040
+
+
+class Refresh:
+  TWEAK = 0
+  TRANSITION = 1
+  CLEAN = 2
+
+  names = ('tweak', 'transition', 'clean')
+
+
+class RefreshScheduler:
+  """
+  Picks how the panel refreshes. Value changes on the same screen use the
+  fastest mode and screen transitions normal quality, both as partial
+  updates. Fast updates leave ghosting behind, so after `max_fast` of them,
+  or when a screen with full-screen art appears, the whole panel gets a
+  clean refresh instead. Normal quality updates don't ghost, so they don't
+  count towards `max_fast`.
+
+  `counts` holds how often each kind of refresh was chosen.
+  """
+
+  speeds = (
+      badger2040.UPDATE_TURBO,
+      badger2040.UPDATE_NORMAL,
+      badger2040.UPDATE_NORMAL,
+  )
+
+  def __init__(self, max_fast: int = 12):
+    self.max_fast = max_fast
+    self.fast = 0
+    self.counts = [0, 0, 0]
+
+  def choose(self, transition: bool, art: bool) -> int:
+    if (art and transition) or self.fast >= self.max_fast:
+      refresh = Refresh.CLEAN
+      self.fast = 0
+    elif transition:
+      refresh = Refresh.TRANSITION
+    else:
+      refresh = Refresh.TWEAK
+      self.fast += 1
+
+    self.counts[refresh] += 1
+    return refresh
+
+  def speed(self, refresh: int) -> int:
+    return self.speeds[refresh]
+
+  def report(self) -> str:
+    return ', '.join(f'{name}: {count}' for name, count in zip(Refresh.names, self.counts))
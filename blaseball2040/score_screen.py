@@ -6,20 +6,24 @@ from badger_ui.sized import SizedBox
 from badger_ui.stack import Stack
 from badger_ui.text import TextWidget
 
-from blaseball2040.stat_screen import Game
+from blaseball2040.game import Game
 from blaseball2040.team_score import TeamScore
 
 
 class ScoreScreen(Widget):
   def __init__(self, game: Game):
-    self.game = game
-
     self.child: Widget | None = None
+    self.bind(game)
+
+  def bind(self, game: Game):
+    self.game = game
+    # The final scores are only drawn once, so rebuild rather than update
+    self.child = None
 
   def on_button(self, app: 'App', pressed: dict[int, bool]) -> bool:
     from blaseball2040.splash_screen import SplashScreen
     if pressed[badger2040.BUTTON_B]:
-      app.child = SplashScreen()
+      app.child = app.screens.get(SplashScreen)
       return True
 
     return super().on_button(app, pressed)
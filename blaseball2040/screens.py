@@ -0,0 +1,26 @@
+from badger_ui import Widget
+
+
+class ScreenPool:
+  """
+  Keeps one instance of each screen class for the life of the app. A screen
+  is built the first time it's asked for, after that the same instance is
+  re-bound to the new arguments with its `bind()` method, so its widget tree
+  and assets are reused instead of rebuilt on every transition.
+
+  `bind()` takes the same arguments as the constructor and resets the
+  screen's state. Widgets that depend on that state have to be updated by
+  the next build rather than thrown away.
+  """
+
+  def __init__(self):
+    self.screens: dict[type, Widget] = {}
+
+  def get(self, screen_type: type, *args, **kwargs) -> Widget:
+    screen = self.screens.get(screen_type)
+    if screen is None:
+      screen = screen_type(*args, **kwargs)
+      self.screens[screen_type] = screen
+    else:
+      screen.bind(*args, **kwargs)
+    return screen
@@ -2,45 +2,44 @@ import badger2040
 from badger_ui import App, Offset, Size, Widget
 from badger_ui.align import Center
 from badger_ui.column import Column
-from badger_ui.image import ImageWidget
 from badger_ui.positioned import Positioned
 from badger_ui.sized import SizedBox
 from badger_ui.stack import Stack
 from badger_ui.text import TextWidget
-from badger_ui.util import Image
 
-from blaseball2040 import assets_dir
-from blaseball2040.stat_screen import Game, StatScreen
-
-teams = [
-    'THE CANIS UNDERDOGS',
-    'THE AURIC ALLSTARS',
-]
+from blaseball2040.image import BackgroundWidget, RLEImage
+from blaseball2040.teams import teams
 
 
 class SelectScreen(Widget):
+  background = 'vs.rle'
+
   def __init__(self) -> None:
-    self.vs_image = Image(f'{assets_dir}/vs.bin', 296, 128)
-    self.vs_image.load()
+    self.vs_image = RLEImage(self.background, 296, 128)
+
+    self.team1: Column | None = None
+    self.team2: Column | None = None
+    self.child: Widget | None = None
+    self.bind()
 
+  def bind(self):
     self.player_index = 0
     self.player_team_index = [
         0,
         1,
     ]
 
-    self.team1: Column | None = None
-    self.team2: Column | None = None
-    self.child: Widget | None = None
-
   def on_button(self, app: 'App', pressed: dict[int, bool]) -> bool:
     if pressed[badger2040.BUTTON_A]:
       self.player_index = (self.player_index - 1) % 2
       return True
 
     elif pressed[badger2040.BUTTON_B]:
-      app.display.invert(False)
-      app.child = StatScreen(
+      from blaseball2040.game import Game
+      from blaseball2040.stat_screen import StatScreen
+      app.invert(False)
+      app.child = app.screens.get(
+          StatScreen,
           game=Game(
               team1=teams[self.player_team_index[0]],
               team2=teams[self.player_team_index[1]],
@@ -53,11 +52,11 @@ class SelectScreen(Widget):
       return True
 
     elif pressed[badger2040.BUTTON_UP]:
-      self.player_team_index[self.player_index] = (self.player_team_index[self.player_index] + 1) % len(teams)
+      self.player_team_index[self.player_index] = (self.player_team_index[self.player_index] + pressed[badger2040.BUTTON_UP]) % len(teams)
       return True
 
     elif pressed[badger2040.BUTTON_DOWN]:
-      self.player_team_index[self.player_index] = (self.player_team_index[self.player_index] - 1) % len(teams)
+      self.player_team_index[self.player_index] = (self.player_team_index[self.player_index] - pressed[badger2040.BUTTON_DOWN]) % len(teams)
       return True
 
     return super().on_button(app, pressed)
@@ -96,7 +95,7 @@ class SelectScreen(Widget):
     if self.child:
       return
     self.child = Stack(children=[
-        ImageWidget(self.vs_image),
+        BackgroundWidget(self.vs_image),
         SizedBox(
             child=Center(child=self.team1),
             size=Size(size.width // 2, size.height),
@@ -111,7 +110,7 @@ class SelectScreen(Widget):
     ])
 
   def render(self, app: 'App', size: Size, offset: Offset):
-    app.display.invert(self.player_index == 1)
+    app.invert(self.player_index == 1)
 
     self.build(app, size, offset)
     self.child.render(app, size, offset)
@@ -1,23 +1,27 @@
 import badger2040
 from badger_ui import App, Offset, Size, Widget
-from badger_ui.util import Image
 
-from blaseball2040 import assets_dir
-from blaseball2040.select_screen import SelectScreen
+from blaseball2040.image import BackgroundWidget, RLEImage
 
 
 class SplashScreen(Widget):
+  background = 'logo.rle'
+  overlay = False
+
   def __init__(self) -> None:
-    self.logo = Image(f'{assets_dir}/logo.bin', 296, 128)
-    self.logo.load()
+    self.logo = BackgroundWidget(RLEImage(self.background, 296, 128))
+
+  def bind(self):
+    pass
 
   def on_button(self, app: 'App', pressed: dict[int, bool]) -> bool:
     if pressed[badger2040.BUTTON_B]:
-      app.child = SelectScreen()
+      from blaseball2040.select_screen import SelectScreen
+      app.child = app.screens.get(SelectScreen)
       return True
 
     return super().on_button(app, pressed)
 
   def render(self, app: 'App', size: Size, offset: Offset):
-    app.display.invert(False)
-    self.logo.draw(app.display, offset=offset)
+    app.invert(False)
+    self.logo.render(app, size, offset)
@@ -0,0 +1,43 @@
+import time
+
+# What the app needs to put the splash screen on the panel, in import order.
+# Importing them one by one times each on its own, as later imports find
+# their dependencies already loaded.
+SPLASH_MODULES = (
+    'badger2040',
+    'badger_ui',
+    'blaseball2040.assets',
+    'blaseball2040.image',
+    'blaseball2040.splash_screen',
+    'blaseball2040.buttons',
+    'blaseball2040.framebuffer',
+    'blaseball2040.refresh',
+    'blaseball2040.screens',
+    'blaseball2040.app',
+)
+
+
+class StartupTimer:
+  """
+  Times the steps of starting the app. Each mark() prints the time since
+  the previous mark, and the time since boot, so the time to the logo can
+  be read off the serial console as the app starts.
+  """
+
+  def __init__(self):
+    self.started = time.ticks_ms()
+    self.last = self.started
+
+  def lap(self):
+    # Starts the next step now, leaving out the time since the last mark
+    self.last = time.ticks_ms()
+
+  def mark(self, name: str):
+    now = time.ticks_ms()
+    ms = time.ticks_diff(now, self.last)
+    self.last = now
+    print(f'{name}: {ms} ms ({time.ticks_diff(now, self.started)} ms)')
+
+  def load(self, module: str):
+    __import__(module)
+    self.mark(f'import {module}')
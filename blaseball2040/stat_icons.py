@@ -0,0 +1,10 @@
+# Code generated by image_converter.py.
+
+SHEET = 'stats.bin'
+SIZE = 32
+COUNT = 3
+NAMES = ('ball', 'strike', 'out')
+
+BALL = 0
+STRIKE = 1
+OUT = 2
@@ -8,47 +8,24 @@ from badger_ui.row import Row
 from badger_ui.sized import SizedBox
 from badger_ui.stack import Stack
 from badger_ui.text import TextWidget
-from badger_ui.util import IconSheet
 
-from blaseball2040 import assets_dir
+from blaseball2040 import stat_icons
+from blaseball2040.dirty import DirtyRect
+from blaseball2040.game import Game, Inning, Screen
+from blaseball2040.image import StripIconSheet
 from blaseball2040.team_score import TeamScore
 
 
-class Inning:
-  TOP = 0
-  BOTTOM = 1
-  OVER = 2
-
-
 class Selection:
   BALLS = 0
   STRIKES = 1
   OUTS = 2
 
 
-class Game:
-  def __init__(
-      self,
-      team1: str,
-      team2: str,
-      inning: int = Inning.TOP,
-      score1: int = 0,
-      score2: int = 0,
-      outs: int = 0,
-      strikes: int = 0,
-      balls: int = 0,
-  ):
-    self.team1 = team1
-    self.team2 = team2
-    self.inning = inning
-    self.score1 = score1
-    self.score2 = score2
-    self.outs = outs
-    self.strikes = strikes
-    self.balls = balls
-
-
 class StatScreen(Widget):
+  # Redrawn in place by the app, only changed widgets refresh
+  partial = True
+
   stat_offsets = [
       Offset(badger2040.WIDTH // 4 * 1, 96) - Offset(32, 16),
       Offset(badger2040.WIDTH // 4 * 2, 96) - Offset(32, 16),
@@ -56,11 +33,7 @@ class StatScreen(Widget):
   ]
 
   def __init__(self, game: Game):
-    self.icons = IconSheet(f'{assets_dir}/stats.bin', 32, 3)
-    self.icons.load()
-
-    self.game = game
-    self.selected_index = 0
+    self.icons = StripIconSheet(stat_icons.SHEET, stat_icons.SIZE, stat_icons.COUNT)
 
     self.team1: TeamScore | None = None
     self.team2: TeamScore | None = None
@@ -68,51 +41,47 @@ class StatScreen(Widget):
     self.strikes: StatWidget | None = None
     self.outs: StatWidget | None = None
     self.child: Widget | None = None
+    self.bind(game)
+
+  def bind(self, game: Game):
+    self.game = game
+    self.selected_index = 0
+
+  def dismiss(self, app: 'App'):
+    self.icons.release()
 
   def on_button(self, app: 'App', pressed: dict[int, bool]) -> bool:
-    from blaseball2040.pitch_screen import (BallScreen, OutScreen, PitchScreen,
-                                            StrikeScreen)
+    from blaseball2040.pitch_screen import show
 
     if pressed[badger2040.BUTTON_A]:
       self.selected_index = (self.selected_index - 1) % 3
       return True
 
     elif pressed[badger2040.BUTTON_B]:
-      app.child = PitchScreen(self.game)
+      show(app, self.game.next_pitch(), self.game)
       return True
 
     elif pressed[badger2040.BUTTON_C]:
       self.selected_index = (self.selected_index + 1) % 3
       return True
 
-    elif pressed[badger2040.BUTTON_UP]:
-      if self.selected_index == Selection.OUTS:
-        self.game.outs += 1
-        if self.game.outs >= 3:
-          app.child = OutScreen(self.game)
-      elif self.selected_index == Selection.STRIKES:
-        self.game.strikes += 1
-        if self.game.strikes >= 3:
-          app.child = StrikeScreen(self.game)
-      elif self.selected_index == Selection.BALLS:
-        self.game.balls += 1
-        if self.game.balls >= 4:
-          app.child = BallScreen(self.game)
-      return True
-
-    elif pressed[badger2040.BUTTON_DOWN]:
+    elif pressed[badger2040.BUTTON_UP] or pressed[badger2040.BUTTON_DOWN]:
+      amount = pressed[badger2040.BUTTON_UP] - pressed[badger2040.BUTTON_DOWN]
       if self.selected_index == Selection.OUTS:
-        self.game.outs = max(self.game.outs - 1, 0)
+        screen = self.game.add_outs(amount)
       elif self.selected_index == Selection.STRIKES:
-        self.game.strikes = max(self.game.strikes - 1, 0)
-      elif self.selected_index == Selection.BALLS:
-        self.game.balls = max(self.game.balls - 1, 0)
+        screen = self.game.add_strikes(amount)
+      else:
+        screen = self.game.add_balls(amount)
+      if screen != Screen.STAT:
+        show(app, screen, self.game)
       return True
 
     return super().on_button(app, pressed)
 
   def build(self, app: 'App', size: Size, offset: Offset):
     if self.team1:
+      self.team1.name = self.game.team1
       self.team1.score = self.game.score1
       self.team1.selected = self.game.inning == Inning.TOP
     else:
@@ -123,6 +92,7 @@ class StatScreen(Widget):
       )
 
     if self.team2:
+      self.team2.name = self.game.team2
       self.team2.score = self.game.score2
       self.team2.selected = self.game.inning == Inning.BOTTOM
     else:
@@ -138,7 +108,7 @@ class StatScreen(Widget):
     else:
       self.balls = StatWidget(
           icons=self.icons,
-          index=0,
+          index=stat_icons.BALL,
           value=self.game.balls,
           selected=self.selected_index == Selection.BALLS,
       )
@@ -149,7 +119,7 @@ class StatScreen(Widget):
     else:
       self.strikes = StatWidget(
           icons=self.icons,
-          index=1,
+          index=stat_icons.STRIKE,
           value=self.game.strikes,
           selected=self.selected_index == Selection.STRIKES,
       )
@@ -160,7 +130,7 @@ class StatScreen(Widget):
     else:
       self.outs = StatWidget(
           icons=self.icons,
-          index=2,
+          index=stat_icons.OUT,
           value=self.game.outs,
           selected=self.selected_index == Selection.OUTS,
       )
@@ -192,7 +162,7 @@ class StatScreen(Widget):
 
 
 class StatWidget(Widget):
-  def __init__(self, icons: IconSheet, index: int, value: int, selected: bool):
+  def __init__(self, icons: StripIconSheet, index: int, value: int, selected: bool):
     self.icons = icons
     self.index = index
     self.value = value
@@ -200,6 +170,7 @@ class StatWidget(Widget):
 
     self.value_text: TextWidget | None = None
     self.child: Widget | None = None
+    self.dirty = DirtyRect()
 
   def measure(self, app: 'App', size: Size) -> Size:
     return Size(self.icons.size + 32, 32)
@@ -229,6 +200,15 @@ class StatWidget(Widget):
     )
 
   def render(self, app: 'App', size: Size, offset: Offset):
+    # Covers the underline and a margin for values wider than the text box
+    self.dirty.update(
+        app,
+        (self.value, self.selected),
+        offset.x - 4,
+        offset.y,
+        self.icons.size + 32 + 8,
+        33,
+    )
     self.build(app, size, offset)
     self.child.render(app, size, offset)
     if self.selected:
@@ -5,6 +5,8 @@ from badger_ui.sized import SizedBox
 from badger_ui.stack import Stack
 from badger_ui.text import TextWidget
 
+from blaseball2040.dirty import DirtyRect
+
 
 class TeamScore(Widget):
   def __init__(self, name: str, score: int, selected: bool):
@@ -15,6 +17,7 @@ class TeamScore(Widget):
     self.name_text: TextWidget | None = None
     self.score_text: TextWidget | None = None
     self.child: Widget | None = None
+    self.dirty = DirtyRect()
 
   def measure(self, app: 'App', size: Size) -> Size:
     return Size(size.width, 25)
@@ -62,6 +65,14 @@ class TeamScore(Widget):
     )
 
   def render(self, app: 'App', size: Size, offset: Offset):
+    self.dirty.update(
+        app,
+        (self.name, self.score, self.selected),
+        offset.x,
+        offset.y,
+        size.width,
+        size.height,
+    )
     self.build(app, size, offset)
 
     if self.selected:
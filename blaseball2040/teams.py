@@ -0,0 +1,4 @@
+teams = [
+    'THE CANIS UNDERDOGS',
+    'THE AURIC ALLSTARS',
+]
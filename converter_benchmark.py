@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Benchmarks the image_converter.py pipeline.
+
+Times the decode, resize, contrast, dither, invert/pack and emit stages
+separately over several corpora and reports the time and peak memory of each
+stage, so regressions in the asset pipeline show up before a release.
+
+Most of a stage's memory is PIL's pixel buffers, allocated in C where
+tracemalloc can't see them. On Linux the peak is measured from the process
+instead: the rise in its resident set size over the stage, read from
+/proc/self/status after resetting the high-water mark, or the growth in
+what malloc holds once the stage returns, whichever is larger. The kernel
+counts RSS in batches of pages, so transient peaks under about 100 KiB are
+approximate, while malloc's figure is exact. Elsewhere it falls back to the
+Python heap traced by tracemalloc, and the report says so.
+
+Corpora:
+  images     the source images in images/, only oversized ones are resized
+  synthetic  generated 296x128 noise and gradient frames
+  large      generated oversized photos that get resized to 296x128
+  many       a large batch of generated 296x128 frames
+
+Results can be saved with --json and compared between commits.
+"""
+
+import argparse
+import ctypes
+import io
+import json
+import re
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from PIL import Image
+
+import image_converter
+
+STAGES = ('decode', 'resize', 'contrast', 'dither', 'pack', 'emit')
+
+parser = argparse.ArgumentParser(description='Benchmarks the image conversion pipeline.')
+parser.add_argument('corpus', nargs='*', default=['images', 'synthetic', 'large', 'many'], help='corpora to run')
+parser.add_argument('--repeat', type=int, default=3, help='runs per corpus, the fastest is reported')
+parser.add_argument('--many', type=int, default=200, help='number of frames in the many corpus')
+parser.add_argument('--emit', choices=('binary', 'rle', 'py'), default='py', help='output format to emit')
+parser.add_argument('--json', type=Path, default=None, help='save results as JSON')
+
+
+def synthetic_frame(index, size=(296, 128)):
+  if index % 2:
+    return Image.effect_noise(size, 64 + index % 64).convert('RGB')
+  return Image.linear_gradient('L').rotate(index * 7 % 360).resize(size)
+
+
+def write_corpus(name, directory, many):
+  images_dir = Path(__file__).parent / 'images'
+  if name == 'images':
+    return image_converter.expand_inputs([str(images_dir), str(images_dir / 'stats')])
+
+  if name == 'synthetic':
+    frames = [synthetic_frame(index) for index in range(8)]
+  elif name == 'large':
+    frames = [synthetic_frame(index, (2960, 1280)) for index in range(4)]
+  elif name == 'many':
+    frames = [synthetic_frame(index) for index in range(many)]
+  else:
+    parser.error(f'unknown corpus {name}')
+
+  filenames = []
+  for index, frame in enumerate(frames):
+    filename = directory / f'{name}-{index}.png'
+    frame.save(filename)
+    filenames.append(str(filename))
+  return filenames
+
+
+def emit(data, width, fmt):
+  if fmt == 'binary':
+    return io.BytesIO().write(data)
+  elif fmt == 'rle':
+    return len(image_converter.encode_rle(data, width))
+  out = io.StringIO()
+  image_converter.write_bytes(out, '_data', data)
+  return out.tell()
+
+
+def decode(filename):
+  img = Image.open(filename)
+  img.load()
+  return img
+
+
+def run_stages(filename, fmt, measure):
+  # measure(stage, fn, *args) runs one stage and returns its result
+  img = measure('decode', decode, filename)
+  # As with --resize, only images bigger than the display are scaled down
+  if img.width > 296 or img.height > 128:
+    img = measure('resize', image_converter.resize_image, img)
+  img = measure('contrast', image_converter.enhance_contrast, img)
+  img = measure('dither', image_converter.dither, img)
+  data = measure('pack', image_converter.pack_image, img)
+  measure('emit', emit, data, img.width, fmt)
+
+
+def time_corpus(filenames, fmt):
+  times = dict.fromkeys(STAGES, 0.0)
+
+  def measure(stage, fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    times[stage] += time.perf_counter() - start
+    return result
+
+  for filename in filenames:
+    run_stages(filename, fmt, measure)
+  return times
+
+
+class MallocInfo(ctypes.Structure):
+  # glibc's struct mallinfo2
+  _fields_ = [(name, ctypes.c_size_t) for name in (
+      'arena', 'ordblks', 'smblks', 'hblks', 'hblkhd',
+      'usmblks', 'fsmblks', 'uordblks', 'fordblks', 'keepcost',
+  )]
+
+
+class ResidentMemory:
+  """
+  Peak memory from the process's resident set size and malloc's own
+  accounting, which include the pixel buffers PIL allocates in C.
+  """
+
+  name = 'rss'
+
+  @staticmethod
+  def map_large_blocks():
+    # Has malloc map and unmap large blocks on their own rather than reuse
+    # freed heap, so each stage's buffers show up in the RSS. Has to be set
+    # before the heap has grown.
+    try:
+      ctypes.CDLL(None).mallopt(-3, 64 * 1024)  # M_MMAP_THRESHOLD
+    except (AttributeError, OSError):
+      pass
+
+  @staticmethod
+  def available():
+    try:
+      with open('/proc/self/clear_refs', 'w') as f:
+        f.write('5')
+      return True
+    except OSError:
+      return False
+
+  def __init__(self):
+    try:
+      self.mallinfo2 = ctypes.CDLL(None).mallinfo2
+      self.mallinfo2.restype = MallocInfo
+    except (AttributeError, OSError):
+      self.mallinfo2 = None
+
+  def held(self):
+    # Bytes malloc has handed out, from the heap and mapped on their own
+    if self.mallinfo2 is None:
+      return 0
+    info = self.mallinfo2()
+    return info.uordblks + info.hblkhd
+
+  def status(self, field):
+    with open('/proc/self/status') as f:
+      return int(re.search(rf'^{field}:\s+(\d+) kB', f.read(), re.M)[1]) * 1024
+
+  def start(self):
+    # Writing 5 resets the high-water mark to the current RSS
+    with open('/proc/self/clear_refs', 'w') as f:
+      f.write('5')
+    self.before = self.status('VmRSS')
+    self.held_before = self.held()
+
+  def peak(self):
+    return max(self.status('VmHWM') - self.before, self.held() - self.held_before, 0)
+
+  def stop(self):
+    pass
+
+
+class TracedMemory:
+  """
+  Peak memory of the Python heap, without PIL's pixel buffers.
+  """
+
+  name = 'traced'
+
+  def __init__(self):
+    tracemalloc.start()
+
+  def start(self):
+    tracemalloc.reset_peak()
+    self.before, _ = tracemalloc.get_traced_memory()
+
+  def peak(self):
+    _, peak = tracemalloc.get_traced_memory()
+    return peak - self.before
+
+  def stop(self):
+    tracemalloc.stop()
+
+
+def trace_corpus(filenames, fmt):
+  peaks = dict.fromkeys(STAGES, 0)
+  memory = ResidentMemory() if ResidentMemory.available() else TracedMemory()
+
+  def measure(stage, fn, *args):
+    memory.start()
+    result = fn(*args)
+    peaks[stage] = max(peaks[stage], memory.peak())
+    return result
+
+  try:
+    for filename in filenames:
+      run_stages(filename, fmt, measure)
+  finally:
+    memory.stop()
+  return memory.name, peaks
+
+
+def benchmark(name, filenames, options):
+  runs = [time_corpus(filenames, options.emit) for _ in range(options.repeat)]
+  times = {stage: min(run[stage] for run in runs) for stage in STAGES}
+  memory, peaks = trace_corpus(filenames, options.emit)
+  return {
+      'corpus': name,
+      'files': len(filenames),
+      'emit': options.emit,
+      'seconds': times,
+      'total_seconds': sum(times.values()),
+      'files_per_second': len(filenames) / sum(times.values()),
+      'memory': memory,
+      'peak_bytes': peaks,
+  }
+
+
+def report(result):
+  print(f"{result['corpus']}: {result['files']} files, {result['total_seconds'] * 1000:.1f} ms, {result['files_per_second']:.1f} files/s, {result['memory']} peaks")
+  for stage in STAGES:
+    print(f"  {stage:<10}{result['seconds'][stage] * 1000:>10.2f} ms{result['peak_bytes'][stage] / 1024:>10.1f} KiB")
+
+
+def main():
+  options = parser.parse_args()
+  ResidentMemory.map_large_blocks()
+  results = []
+  with tempfile.TemporaryDirectory() as directory:
+    for name in options.corpus:
+      filenames = write_corpus(name, Path(directory), options.many)
+      result = benchmark(name, filenames, options)
+      report(result)
+      results.append(result)
+
+  if options.json is not None:
+    with open(options.json, 'w') as f:
+      json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+  main()
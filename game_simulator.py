@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Simulates large batches of games at once for balancing the rules.
+
+Every game in a batch is a row in a set of NumPy arrays. Each step throws
+one pitch in every unfinished game, using the resolution rules from
+blaseball2040.game:
+
+  base = bat - pitch    0 is a ball, below 0 a strike, 1 to 3 the bases
+                        reached and 4 or more a homerun
+  out(bat + 1, catch)   a hit that's caught is an out when the catch beats
+                        the bat + 1, as on the catch screen
+
+Four balls walk the batter and three strikes strike them out. Three outs
+switch sides. The balls, strikes and outs change as they do in the app,
+following blaseball2040.game.TRANSITIONS for each pitch's events (a ball and
+moving on from the ball screen, a caught out, the runs after a safe hit and
+so on). So a caught out keeps the strike count, and a walk or a strikeout
+keeps the other one. The app leaves runners to the players, so here they
+advance as many bases as the hit, and only as far as they're forced on a walk.
+
+Pitch, bat and catch values come from distributions given as NAME:ARGS, for
+example uniform:0:20, normal:10:4 or dice:2:10. Reports the runs scored, the
+length of the games in pitches and the win rates.
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+from blaseball2040.game import BALLS, OUTS, STRIKES, Event, Game, Inning, base, out
+
+# Options for how games are played, shared with season_simulator.py
+rules = argparse.ArgumentParser(add_help=False)
+rules.add_argument('--innings', type=int, default=1, help='innings per game, the app plays one')
+rules.add_argument('--pitch', default='uniform:0:20', help='distribution of pitch values')
+rules.add_argument('--bat', default='uniform:0:20', help='distribution of bat values')
+rules.add_argument('--catch', default='uniform:0:20', help='distribution of catch values')
+rules.add_argument('--catch_rate', type=float, default=0.5, help='chance a hit is fielded for a catch')
+rules.add_argument('--max_pitches', type=int, default=10_000, help='give up on games longer than this')
+
+parser = argparse.ArgumentParser(description='Simulates batches of games to balance the rules.', parents=[rules])
+parser.add_argument('--games', type=int, default=100_000, help='games to simulate')
+parser.add_argument('--batch', type=int, default=1_000_000, help='games simulated at once')
+parser.add_argument('--seed', type=int, default=None, help='random seed')
+parser.add_argument('--json', type=Path, default=None, help='save results as JSON')
+
+
+def distribution(spec: str):
+  """
+  Parses NAME:ARGS into fn(rng, size) returning int values:
+
+    uniform:LOW:HIGH  every value from LOW to HIGH inclusive
+    normal:MEAN:SD    rounded normal values, at least 0
+    dice:COUNT:SIDES  the total of COUNT dice with SIDES sides
+    fixed:VALUE       always VALUE
+  """
+  name, *args = spec.split(':')
+  try:
+    args = [float(arg) for arg in args]
+    if name == 'uniform':
+      low, high = int(args[0]), int(args[1])
+      return lambda rng, size: rng.integers(low, high + 1, size, dtype=np.int16)
+    elif name == 'normal':
+      mean, sd = args
+      return lambda rng, size: np.maximum(np.rint(rng.normal(mean, sd, size)), 0).astype(np.int16)
+    elif name == 'dice':
+      count, sides = int(args[0]), int(args[1])
+      return lambda rng, size: rng.integers(1, sides + 1, (count, size), dtype=np.int16).sum(axis=0, dtype=np.int16)
+    elif name == 'fixed':
+      value = int(args[0])
+      return lambda rng, size: np.full(size, value, np.int16)
+  except (IndexError, ValueError):
+    pass
+  raise ValueError(f'bad distribution {spec}')
+
+
+def _values(spec):
+  # A distribution spec or an fn(rng, size) of its own
+  return spec if callable(spec) else distribution(spec)
+
+
+# What a pitch can come to, and the events the app applies for each
+BALL_PITCH = 0
+STRIKE_PITCH = 1
+CAUGHT_HIT = 2
+SAFE_HIT = 3
+UNFIELDED_HIT = 4
+EVENTS = (
+    (Event.BALL, Event.BALL_SHOWN),
+    (Event.STRIKE, Event.STRIKE_SHOWN),
+    (Event.HIT, Event.CAUGHT_OUT, Event.OUT_SHOWN),
+    (Event.HIT, Event.SAFE, Event.RUNS),
+    (Event.HIT, Event.NO_CATCH, Event.RUNS),
+)
+
+
+def _counts() -> np.ndarray:
+  # counts[pitch, balls, strikes, outs] is the balls, strikes and outs after
+  # a pitch that comes to `pitch`, and whether it switched sides. They're
+  # worked out by applying the pitch's events to a Game, so they follow
+  # game.TRANSITIONS. The third out always switches sides here, as if its
+  # out screen was moved on from. Only the next screen depends on the
+  # inning, so the top's counts do for both halves.
+  counts = np.zeros((len(EVENTS), BALLS, STRIKES, OUTS, 4), np.int8)
+  for pitch, events in enumerate(EVENTS):
+    for balls, strikes, outs in np.ndindex(BALLS, STRIKES, OUTS):
+      game = Game('', '', outs=outs, strikes=strikes, balls=balls)
+      for event in events:
+        game.apply(event)
+      if game.switch:
+        game.apply(Event.OUT_SHOWN)
+      counts[pitch, balls, strikes, outs] = game.balls, game.strikes, game.outs, game.inning != Inning.TOP
+  return counts
+
+
+COUNTS = _counts()
+
+
+def _popcount4(bits: np.ndarray) -> np.ndarray:
+  # A homerun brings in the batter and up to three runners
+  return (bits & 1) + (bits >> 1 & 1) + (bits >> 2 & 1) + (bits >> 3 & 1)
+
+
+def simulate(
+    games: int,
+    rng: np.random.Generator,
+    options,
+    skill1: np.ndarray | None = None,
+    skill2: np.ndarray | None = None,
+) -> dict[str, np.ndarray]:
+  """
+  Plays `games` games with the distributions and rules in `options`, where
+  pitch, bat and catch can also be fn(rng, size) distributions. A team's
+  `skill` in each game is added to its bat values when batting and to its
+  pitch and catch values when fielding. Returns
+  their final scores as `score1` and `score2`, their lengths in pitches as
+  `pitches` and which ones hit `max_pitches` before finishing as
+  `unfinished`.
+  """
+  pitch_values = _values(options.pitch)
+  bat_values = _values(options.bat)
+  catch_values = _values(options.catch)
+  halves = 2 * options.innings
+
+  score1 = np.zeros(games, np.int32)
+  score2 = np.zeros(games, np.int32)
+  pitches = np.full(games, options.max_pitches, np.int32)
+
+  # State of the unfinished games, `ids` maps them back to their rows
+  ids = np.arange(games)
+  runs1 = np.zeros(games, np.int32)
+  runs2 = np.zeros(games, np.int32)
+  balls = np.zeros(games, np.int8)
+  strikes = np.zeros(games, np.int8)
+  outs = np.zeros(games, np.int8)
+  half = np.zeros(games, np.int8)
+  # Runners on first, second and third as bits 0, 1 and 2
+  bases = np.zeros(games, np.int8)
+  skilled = skill1 is not None or skill2 is not None
+  if skilled:
+    skill1 = np.zeros(games, np.int16) if skill1 is None else skill1.astype(np.int16)
+    skill2 = np.zeros(games, np.int16) if skill2 is None else skill2.astype(np.int16)
+
+  for step in range(options.max_pitches):
+    if not len(ids):
+      break
+
+    size = len(ids)
+    bottom = (half & 1).astype(bool)
+    bat = bat_values(rng, size)
+    pitch = pitch_values(rng, size)
+    catch = catch_values(rng, size)
+    if skilled:
+      batting = np.where(bottom, skill2, skill1)
+      fielding = np.where(bottom, skill1, skill2)
+      bat = bat + batting
+      pitch = pitch + fielding
+      catch = catch + fielding
+    value = base(pitch, bat)
+
+    hit = value > 0
+    fielded = hit & (rng.random(size) < options.catch_rate)
+    caught = fielded & out(bat + 1, catch)
+    safe = hit & ~caught
+    # BALL_PITCH to UNFIELDED_HIT, from how far each pitch got
+    pitched = (value < 0) + hit * (UNFIELDED_HIT - fielded - caught)
+
+    walk = (value == 0) & (balls == BALLS - 1)
+    # The batter takes first, pushing on only the runners behind them
+    runs = (walk & (bases == 7)).astype(np.int8)
+    bases = np.where(walk, (bases | (~bases & (bases + 1))) & 7, bases)
+
+    reached = np.clip(value, 1, 4).astype(np.int8)
+    advanced = (bases << reached) | (1 << (reached - 1))
+    runs += safe * _popcount4(advanced >> 3)
+    bases = np.where(safe, advanced & 7, bases).astype(np.int8)
+
+    counts = COUNTS[pitched, balls, strikes, outs]
+    balls = counts[:, 0]
+    strikes = counts[:, 1]
+    outs = counts[:, 2]
+    switch = counts[:, 3].astype(bool)
+
+    runs1 += runs * ~bottom
+    runs2 += runs * bottom
+
+    half += switch
+    bases[switch] = 0
+
+    playing = half < halves
+    if not playing.all():
+      over = ~playing
+      score1[ids[over]] = runs1[over]
+      score2[ids[over]] = runs2[over]
+      pitches[ids[over]] = step + 1
+
+      ids = ids[playing]
+      runs1 = runs1[playing]
+      runs2 = runs2[playing]
+      balls = balls[playing]
+      strikes = strikes[playing]
+      outs = outs[playing]
+      half = half[playing]
+      bases = bases[playing]
+      if skilled:
+        skill1 = skill1[playing]
+        skill2 = skill2[playing]
+
+  unfinished = np.zeros(games, bool)
+  unfinished[ids] = True
+  score1[ids] = runs1
+  score2[ids] = runs2
+  return {
+      'score1': score1,
+      'score2': score2,
+      'pitches': pitches,
+      'unfinished': unfinished,
+  }
+
+
+def summarize(results: dict[str, np.ndarray]) -> dict:
+  finished = ~results['unfinished']
+  score1 = results['score1'][finished]
+  score2 = results['score2'][finished]
+  pitches = results['pitches'][finished]
+  games = max(len(pitches), 1)
+
+  def spread(values: np.ndarray) -> dict:
+    if not len(values):
+      return {}
+    return {
+        'mean': float(values.mean()),
+        'sd': float(values.std()),
+        'p50': float(np.percentile(values, 50)),
+        'p90': float(np.percentile(values, 90)),
+        'p99': float(np.percentile(values, 99)),
+        'max': int(values.max()),
+    }
+
+  runs = np.concatenate([score1, score2])
+  return {
+      'games': int(finished.sum()),
+      'unfinished': int((~finished).sum()),
+      'runs': spread(runs),
+      'runs_histogram': np.bincount(runs).tolist() if len(runs) else [],
+      'pitches': spread(pitches),
+      'win_rate': {
+          'team1': float((score1 > score2).sum() / games),
+          'team2': float((score2 > score1).sum() / games),
+          'tie': float((score1 == score2).sum() / games),
+      },
+  }
+
+
+def merge(results: list[dict[str, np.ndarray]]) -> dict[str, np.ndarray]:
+  return {key: np.concatenate([result[key] for result in results]) for key in results[0]}
+
+
+def report(summary: dict, seconds: float):
+  print(f"{summary['games']} games in {seconds:.2f} s, {summary['games'] / seconds:,.0f} games/s, {summary['unfinished']} unfinished")
+  for name in ('runs', 'pitches'):
+    spread = summary[name]
+    if spread:
+      print(f"  {name:<8} mean {spread['mean']:.2f}  sd {spread['sd']:.2f}  p50 {spread['p50']:.0f}  p90 {spread['p90']:.0f}  p99 {spread['p99']:.0f}  max {spread['max']}")
+  histogram = summary['runs_histogram']
+  total = max(sum(histogram), 1)
+  print('  runs per team: ' + '  '.join(f'{runs}: {count / total:.1%}' for runs, count in enumerate(histogram[:10])))
+  win_rate = summary['win_rate']
+  print(f"  wins: team1 {win_rate['team1']:.1%}  team2 {win_rate['team2']:.1%}  tie {win_rate['tie']:.1%}")
+
+
+def main():
+  options = parser.parse_args()
+  try:
+    for spec in (options.pitch, options.bat, options.catch):
+      distribution(spec)
+  except ValueError as e:
+    parser.error(str(e))
+
+  rng = np.random.default_rng(options.seed)
+  start = time.perf_counter()
+  results = []
+  for first in range(0, options.games, options.batch):
+    results.append(simulate(min(options.batch, options.games - first), rng, options))
+  seconds = time.perf_counter() - start
+
+  summary = summarize(merge(results))
+  report(summary, seconds)
+  if options.json is not None:
+    with open(options.json, 'w') as f:
+      json.dump(summary, f, indent=2)
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,249 @@
+"""
+Host-side stand-in for the badger2040 MicroPython module.
+
+Renders into an in-memory 1-bit framebuffer with the same column-major
+layout as the badge, so the app can run on a desktop Python without a badge
+attached. Every display call is recorded, and panel updates are kept as an
+image that can be snapshotted and compared pixel for pixel.
+
+Put this directory first on sys.path, so that `badger2040`, `badger_ui`,
+`machine` and `micropython` import the stand-ins:
+
+  sys.path.insert(0, 'host')
+  import badger2040
+
+Importing it also adds MicroPython's ticks_*() and sleep_ms() to `time`.
+
+Text is drawn with PIL's default font scaled to the Hershey font's line
+height, so it lands in the same place as on the badge but is not stroked
+the same way.
+"""
+
+import time
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+import machine
+
+WIDTH = 296
+HEIGHT = 128
+BANDS = HEIGHT // 8
+
+BUTTON_DOWN = 11
+BUTTON_A = 12
+BUTTON_B = 13
+BUTTON_C = 14
+BUTTON_UP = 15
+BUTTON_USER = 23
+
+UPDATE_NORMAL = 0
+UPDATE_MEDIUM = 1
+UPDATE_FAST = 2
+UPDATE_TURBO = 3
+
+if not hasattr(time, 'ticks_ms'):
+  time.ticks_ms = lambda: time.perf_counter_ns() // 1_000_000
+  time.ticks_us = lambda: time.perf_counter_ns() // 1_000
+  time.ticks_add = lambda ticks, delta: ticks + delta
+  time.ticks_diff = lambda end, start: end - start
+  time.sleep_ms = lambda ms: time.sleep(ms / 1000)
+
+# The badge's 4x4 ordered dither matrix for pens between black and white
+_DITHER = np.array([
+    [0, 8, 1, 9],
+    [12, 4, 13, 5],
+    [3, 11, 2, 10],
+    [15, 7, 14, 6],
+])
+
+# Hershey text is 30px per line at scale 1
+_LINE_HEIGHT = 30
+
+_fonts: dict[int, ImageFont.FreeTypeFont] = {}
+
+
+def _font(scale: float) -> ImageFont.FreeTypeFont:
+  size = max(round(_LINE_HEIGHT * scale), 1)
+  font = _fonts.get(size)
+  if font is None:
+    font = _fonts[size] = ImageFont.load_default(size)
+  return font
+
+
+def _unpack(data, width: int, height: int) -> np.ndarray:
+  # Row-major 1-bit image data as a (height, width) array, True for black
+  stride = (width + 7) // 8
+  rows = np.frombuffer(bytes(data[:stride * height]), np.uint8).reshape(height, stride)
+  return np.unpackbits(rows, axis=1)[:, :width].astype(bool)
+
+
+class Badger2040:
+  def __init__(self, buffer: bytearray | None = None):
+    # Column-major, HEIGHT // 8 bytes per x column, MSB at the top of each
+    # band and set for black.
+    self.buffer = buffer if buffer is not None else bytearray(WIDTH * BANDS)
+    self.frame = np.frombuffer(self.buffer, np.uint8).reshape(WIDTH, BANDS)
+
+    # What the e-ink panel shows, as (HEIGHT, WIDTH) with True for black
+    self.panel = np.zeros((HEIGHT, WIDTH), bool)
+
+    self.calls: list[tuple] = []
+    self._pen = 0
+    self._thickness = 1
+    self._inverted = False
+    self._speed = UPDATE_NORMAL
+
+  def record(self, name: str, *args):
+    self.calls.append((name, *args))
+
+  def pixels(self) -> np.ndarray:
+    # The framebuffer as (HEIGHT, WIDTH), True for black
+    return np.unpackbits(self.frame, axis=1).astype(bool).T
+
+  def store(self, pixels: np.ndarray):
+    self.frame[:] = np.packbits(pixels.T, axis=1)
+
+  def paint(self, x: int, y: int, mask: np.ndarray):
+    # Fills the True pixels of `mask`, placed at x, y, with the current pen
+    self.blit(x, y, mask, self.ink(x, y, mask.shape[1], mask.shape[0]), mask)
+
+  def blit(self, x: int, y: int, source: np.ndarray, ink: np.ndarray | None = None, mask: np.ndarray | None = None):
+    # Copies `ink` (or `source` itself) over the frame at x, y where `mask`
+    # is set, or everywhere if there is no mask, clipped to the screen.
+    height, width = source.shape
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + width, WIDTH), min(y + height, HEIGHT)
+    if x1 <= x0 or y1 <= y0:
+      return
+
+    window = (slice(y0 - y, y1 - y), slice(x0 - x, x1 - x))
+    ink = source[window] if ink is None else ink[window]
+    pixels = self.pixels()
+    target = pixels[y0:y1, x0:x1]
+    if mask is None:
+      target[:] = ink
+    else:
+      mask = mask[window]
+      target[mask] = ink[mask]
+    self.store(pixels)
+
+  def ink(self, x: int, y: int, width: int, height: int) -> np.ndarray:
+    # The current pen over an area, dithered like the badge: 0 is black and
+    # 15 is white.
+    pattern = self._pen * 16 < _DITHER * 15 + 8
+    return pattern[np.arange(y, y + height) & 3][:, np.arange(x, x + width) & 3]
+
+  # Drawing state
+
+  def pen(self, color: int):
+    self.record('pen', color)
+    self._pen = color
+
+  def thickness(self, thickness: int):
+    self.record('thickness', thickness)
+    self._thickness = thickness
+
+  def font(self, name: str):
+    self.record('font', name)
+
+  def invert(self, inverted: bool):
+    self.record('invert', inverted)
+    self._inverted = inverted
+
+  def update_speed(self, speed: int):
+    self.record('update_speed', speed)
+    self._speed = speed
+
+  def led(self, brightness: int):
+    self.record('led', brightness)
+
+  # Drawing
+
+  def clear(self):
+    self.record('clear')
+    self.paint(0, 0, np.ones((HEIGHT, WIDTH), bool))
+
+  def pixel(self, x: int, y: int):
+    self.record('pixel', x, y)
+    self.paint(x, y, np.ones((1, 1), bool))
+
+  def rectangle(self, x: int, y: int, width: int, height: int):
+    self.record('rectangle', x, y, width, height)
+    if width > 0 and height > 0:
+      self.paint(x, y, np.ones((height, width), bool))
+
+  def line(self, x1: int, y1: int, x2: int, y2: int):
+    self.record('line', x1, y1, x2, y2)
+    steps = max(abs(x2 - x1), abs(y2 - y1), 1)
+    xs = np.rint(np.linspace(x1, x2, steps + 1)).astype(int)
+    ys = np.rint(np.linspace(y1, y2, steps + 1)).astype(int)
+
+    # Strokes the line with a square brush `thickness` wide
+    t = self._thickness
+    left, top = xs.min() - t // 2, ys.min() - t // 2
+    mask = np.zeros((ys.max() - ys.min() + t, xs.max() - xs.min() + t), bool)
+    for dx in range(t):
+      for dy in range(t):
+        mask[ys - ys.min() + dy, xs - xs.min() + dx] = True
+    self.paint(left, top, mask)
+
+  def image(self, data, width: int, height: int, x: int, y: int):
+    self.record('image', width, height, x, y)
+    self.blit(x, y, _unpack(data, width, height))
+
+  def icon(self, data, index: int, sheet_width: int, size: int, x: int, y: int):
+    self.record('icon', index, sheet_width, size, x, y)
+    sheet = _unpack(data, sheet_width, size)
+    self.blit(x, y, sheet[:, index * size:(index + 1) * size])
+
+  def text(self, message: str, x: int, y: int, scale: float = 1.0, rotation: float = 0.0):
+    # y is the middle of the line, as with the badge's Hershey text
+    self.record('text', message, x, y, scale, rotation)
+    font = _font(scale)
+    width = max(round(font.getlength(message)), 1)
+    height = max(round(_LINE_HEIGHT * scale), 1)
+    canvas = Image.new('1', (width, height))
+    ImageDraw.Draw(canvas).text((0, height // 2), message, fill=1, font=font, anchor='lm')
+    self.paint(x, y - height // 2, np.array(canvas, bool))
+
+  def measure_text(self, message: str, scale: float = 1.0) -> int:
+    return round(_font(scale).getlength(message))
+
+  # Panel
+
+  def update(self):
+    self.record('update', self._speed)
+    self.show(0, 0, WIDTH, HEIGHT)
+
+  def partial_update(self, x: int, y: int, width: int, height: int):
+    self.record('partial_update', self._speed, x, y, width, height)
+    self.show(x, y, width, height)
+
+  def show(self, x: int, y: int, width: int, height: int):
+    pixels = self.pixels()
+    if self._inverted:
+      pixels = ~pixels
+    self.panel[y:y + height, x:x + width] = pixels[y:y + height, x:x + width]
+
+  def is_busy(self) -> bool:
+    return False
+
+  def halt(self):
+    self.record('halt')
+
+  def pressed(self, button: int) -> bool:
+    return machine.Pin.pins[button].active() if button in machine.Pin.pins else False
+
+  # Snapshots
+
+  def snapshot(self) -> Image.Image:
+    # What the panel shows, black on white
+    return Image.fromarray(~self.panel)
+
+  def save(self, filename: str):
+    self.snapshot().save(filename)
+
+  def matches(self, filename: str) -> bool:
+    golden = np.array(Image.open(filename).convert('1'), bool)
+    return golden.shape == self.panel.shape and bool((golden == ~self.panel).all())
@@ -0,0 +1,51 @@
+"""
+Host-side stand-in for North101/badger_ui, the widget library the app is
+built on.
+
+Only the widgets the app uses are here, laid out the way the library lays
+them out, so the app renders on the badger2040 stand-in without the
+library installed. Each widget is measured against the size it is offered
+and rendered at an offset on the display.
+"""
+
+import badger2040
+
+
+class Offset:
+  def __init__(self, x: int, y: int):
+    self.x = x
+    self.y = y
+
+  def __add__(self, other: 'Offset'):
+    return Offset(self.x + other.x, self.y + other.y)
+
+  def __sub__(self, other: 'Offset'):
+    return Offset(self.x - other.x, self.y - other.y)
+
+
+class Size:
+  def __init__(self, width: int, height: int):
+    self.width = width
+    self.height = height
+
+
+class Widget:
+  def on_button(self, app: 'App', pressed: dict[int, bool]) -> bool:
+    return False
+
+  def measure(self, app: 'App', size: Size) -> Size:
+    return size
+
+  def render(self, app: 'App', size: Size, offset: Offset):
+    pass
+
+
+class App(Widget):
+  def __init__(self):
+    self.display = badger2040.Badger2040()
+    self.child: Widget | None = None
+
+  def on_button(self, app: 'App', pressed: dict[int, bool]) -> bool:
+    if self.child is None:
+      return False
+    return self.child.on_button(app, pressed)
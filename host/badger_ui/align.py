@@ -0,0 +1,37 @@
+from badger_ui import App, Offset, Size, Widget
+
+
+class Center(Widget):
+  def __init__(self, child: Widget):
+    self.child = child
+
+  def render(self, app: App, size: Size, offset: Offset):
+    child_size = self.child.measure(app, size)
+    self.child.render(app, child_size, Offset(
+        offset.x + (size.width - child_size.width) // 2,
+        offset.y + (size.height - child_size.height) // 2,
+    ))
+
+
+class Left(Widget):
+  def __init__(self, child: Widget):
+    self.child = child
+
+  def render(self, app: App, size: Size, offset: Offset):
+    child_size = self.child.measure(app, size)
+    self.child.render(app, child_size, Offset(
+        offset.x,
+        offset.y + (size.height - child_size.height) // 2,
+    ))
+
+
+class Right(Widget):
+  def __init__(self, child: Widget):
+    self.child = child
+
+  def render(self, app: App, size: Size, offset: Offset):
+    child_size = self.child.measure(app, size)
+    self.child.render(app, child_size, Offset(
+        offset.x + size.width - child_size.width,
+        offset.y + (size.height - child_size.height) // 2,
+    ))
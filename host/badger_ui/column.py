@@ -0,0 +1,20 @@
+from badger_ui import App, Offset, Size, Widget
+
+
+class Column(Widget):
+  def __init__(self, children: list[Widget]):
+    self.children = children
+
+  def measure(self, app: App, size: Size) -> Size:
+    sizes = [child.measure(app, size) for child in self.children]
+    return Size(
+        max((child_size.width for child_size in sizes), default=0),
+        sum(child_size.height for child_size in sizes),
+    )
+
+  def render(self, app: App, size: Size, offset: Offset):
+    y = offset.y
+    for child in self.children:
+      height = child.measure(app, size).height
+      child.render(app, Size(size.width, height), Offset(offset.x, y))
+      y += height
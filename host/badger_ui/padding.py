@@ -0,0 +1,32 @@
+from badger_ui import App, Offset, Size, Widget
+
+
+class EdgeOffsets:
+  def __init__(self, left: int, top: int, right: int, bottom: int):
+    self.left = left
+    self.top = top
+    self.right = right
+    self.bottom = bottom
+
+  @staticmethod
+  def all(value: int):
+    return EdgeOffsets(value, value, value, value)
+
+
+class Padding(Widget):
+  def __init__(self, child: Widget, padding: EdgeOffsets):
+    self.child = child
+    self.padding = padding
+
+  def measure(self, app: App, size: Size) -> Size:
+    child_size = self.child.measure(app, size)
+    return Size(
+        child_size.width + self.padding.left + self.padding.right,
+        child_size.height + self.padding.top + self.padding.bottom,
+    )
+
+  def render(self, app: App, size: Size, offset: Offset):
+    self.child.render(app, Size(
+        size.width - self.padding.left - self.padding.right,
+        size.height - self.padding.top - self.padding.bottom,
+    ), Offset(offset.x + self.padding.left, offset.y + self.padding.top))
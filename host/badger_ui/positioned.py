@@ -0,0 +1,10 @@
+from badger_ui import App, Offset, Size, Widget
+
+
+class Positioned(Widget):
+  def __init__(self, child: Widget, offset: Offset):
+    self.child = child
+    self.offset = offset
+
+  def render(self, app: App, size: Size, offset: Offset):
+    self.child.render(app, size, offset + self.offset)
@@ -0,0 +1,20 @@
+from badger_ui import App, Offset, Size, Widget
+
+
+class Row(Widget):
+  def __init__(self, children: list[Widget]):
+    self.children = children
+
+  def measure(self, app: App, size: Size) -> Size:
+    sizes = [child.measure(app, size) for child in self.children]
+    return Size(
+        sum(child_size.width for child_size in sizes),
+        max((child_size.height for child_size in sizes), default=0),
+    )
+
+  def render(self, app: App, size: Size, offset: Offset):
+    x = offset.x
+    for child in self.children:
+      width = child.measure(app, size).width
+      child.render(app, Size(width, size.height), Offset(x, offset.y))
+      x += width
@@ -0,0 +1,13 @@
+from badger_ui import App, Offset, Size, Widget
+
+
+class SizedBox(Widget):
+  def __init__(self, child: Widget, size: Size):
+    self.child = child
+    self.size = size
+
+  def measure(self, app: App, size: Size) -> Size:
+    return self.size
+
+  def render(self, app: App, size: Size, offset: Offset):
+    self.child.render(app, self.size, offset)
@@ -0,0 +1,10 @@
+from badger_ui import App, Offset, Size, Widget
+
+
+class Stack(Widget):
+  def __init__(self, children: list[Widget]):
+    self.children = children
+
+  def render(self, app: App, size: Size, offset: Offset):
+    for child in self.children:
+      child.render(app, size, offset)
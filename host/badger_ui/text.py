@@ -0,0 +1,31 @@
+from badger_ui import App, Offset, Size, Widget
+
+
+class TextWidget(Widget):
+  def __init__(
+      self,
+      text: str,
+      line_height: int,
+      thickness: int = 1,
+      color: int = 0,
+      scale: float = 1.0,
+      underline: bool = False,
+  ):
+    self.text = text
+    self.line_height = line_height
+    self.thickness = thickness
+    self.color = color
+    self.scale = scale
+    self.underline = underline
+
+  def measure(self, app: App, size: Size) -> Size:
+    return Size(app.display.measure_text(self.text, self.scale), self.line_height)
+
+  def render(self, app: App, size: Size, offset: Offset):
+    display = app.display
+    display.pen(self.color)
+    display.thickness(self.thickness)
+    display.text(self.text, offset.x, offset.y + self.line_height // 2, self.scale)
+    if self.underline:
+      y = offset.y + self.line_height
+      display.line(offset.x, y, offset.x + display.measure_text(self.text, self.scale), y)
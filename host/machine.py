@@ -0,0 +1,57 @@
+"""
+Host-side stand-in for MicroPython's machine.Pin, for the badger2040
+stand-in. Buttons are pressed with press(), which raises the pin's
+interrupt as the hardware would.
+"""
+
+
+class Pin:
+  IN = 0
+  OUT = 1
+  PULL_UP = 1
+  PULL_DOWN = 2
+  IRQ_FALLING = 4
+  IRQ_RISING = 8
+
+  # Every pin created, by id
+  pins: dict[int, 'Pin'] = {}
+
+  def __init__(self, id: int, mode: int = IN, pull: int | None = None):
+    self.id = id
+    self.mode = mode
+    self.pull = pull
+    # Pulled-up pins idle high and are active low
+    self.level = 1 if pull == Pin.PULL_UP else 0
+    self.handler = None
+    self.trigger = 0
+    Pin.pins[id] = self
+
+  def value(self, level: int | None = None) -> int:
+    if level is None:
+      return self.level
+
+    if level != self.level:
+      self.level = level
+      edge = Pin.IRQ_RISING if level else Pin.IRQ_FALLING
+      if self.handler is not None and self.trigger & edge:
+        self.handler(self)
+    return self.level
+
+  def irq(self, handler=None, trigger: int = IRQ_FALLING | IRQ_RISING):
+    self.handler = handler
+    self.trigger = trigger
+
+  def active(self) -> bool:
+    return self.level == (0 if self.pull == Pin.PULL_UP else 1)
+
+  def hold(self):
+    self.value(0 if self.pull == Pin.PULL_UP else 1)
+
+  def release(self):
+    self.value(1 if self.pull == Pin.PULL_UP else 0)
+
+
+def press(id: int):
+  pin = Pin.pins[id]
+  pin.hold()
+  pin.release()
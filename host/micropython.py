@@ -0,0 +1,16 @@
+"""
+Host-side stand-in for the micropython module. The code emitters are no-ops
+on CPython.
+"""
+
+
+def native(fn):
+  return fn
+
+
+def viper(fn):
+  return fn
+
+
+def const(value):
+  return value
@@ -6,20 +6,67 @@ Optionally resizes images to 296x128 to fit the display.
 
 Crunches images down to dithered, 1bit colour depth.
 
-Outputs either in raw binary format or as a .py file for embedding into MicroPython.
+Outputs either in raw binary format, as PackBits-compressed rows (--rle) or as a
+.py file for embedding into MicroPython.
+
+--sheet packs a directory of square icons into a single icon sheet and writes
+a Python index module naming each icon, e.g.
+
+  image_converter.py --sheet stats --out_dir blaseball2040/assets \\
+      --index blaseball2040/stat_icons.py images/stats
+
+--freeze bundles already converted assets into a package of .py modules for
+freezing into the firmware, along with a manifest.py for the firmware build:
+
+  image_converter.py --freeze --out_dir blaseball2040_assets blaseball2040/assets
+
+--delta takes pairs of full-screen images and writes the changed byte spans
+between them in both directions, e.g. logo_to_vs.delta and vs_to_logo.delta.
+
+--font rasterizes the characters and line heights listed with --glyphs into a
+1-bit font atlas, plus an index module of each glyph's width and offset. The
+glyphs are stroked from the badge's own Hershey font (the Hershey-Fonts
+package), so they match its vector text, e.g.
+
+  image_converter.py --font glyphs --out_dir blaseball2040/assets \\
+      --index blaseball2040/glyphs.py --glyphs 60:0123456789 --glyphs 30:BAT
+
+Large batches can be spread across a process pool with --jobs, as can the
+icons of a --sheet and the line heights of a --font. Outputs whose inputs and
+options are unchanged since the last run are skipped, see BuildCache.
 
 Output to py functionality is borrwed from data_to_py.py, Copyright (c) 2016 Peter Hinch
 """
 
 import argparse
+import hashlib
 import io
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
-from PIL import Image, ImageEnhance
+from PIL import Image, ImageDraw, ImageEnhance
+
+# Bump whenever a change alters the converter's output, so cached outputs
+# written by an older converter are rebuilt.
+CONVERTER_VERSION = 2
 
 PY_HEADER = """# Code generated by convert.py.
 """
 
+# The Hershey fonts' line height at scale 1
+HERSHEY_LINE_HEIGHT = 30
+
+INDEX_HEADER = """# Code generated by image_converter.py.
+"""
+
+MANIFEST = """# Code generated by image_converter.py.
+package('{package}', files={files!r}, base_path='..')
+"""
+
 PY_FOOTER = """_mvdata = memoryview(_data)
 
 def data():
@@ -29,108 +76,610 @@ def data():
 
 
 parser = argparse.ArgumentParser(description='Converts images into the format used by Badger2040.')
-parser.add_argument('file', nargs="+", help='input files to convert')
+parser.add_argument('file', nargs="*", help='input files or directories of .png files to convert')
 parser.add_argument('--out_dir', type=Path, default=None, help='output directory')
 parser.add_argument('--binary', action="store_true", help='output binary file for MicroPython')
+parser.add_argument('--rle', action="store_true", help='output PackBits-compressed rows for MicroPython')
 parser.add_argument('--py', action="store_true", help='output .py file for MicroPython embedding')
+parser.add_argument('--bytes_per_line', type=int, default=16, help='bytes per line of --py output')
+parser.add_argument('--sheet', default=None, help='pack all inputs into one icon sheet with this name')
+parser.add_argument('--font', default=None, help='rasterize --glyphs into a font atlas with this name')
+parser.add_argument('--glyphs', action="append", default=[], help='HEIGHT:CHARS, glyphs to rasterize at a line height for --font')
+parser.add_argument('--hershey', default='futural', help='Hershey font to rasterize for --font, futural is the badge\'s "sans"')
+parser.add_argument('--thickness', type=int, default=2, help='stroke thickness in pixels for --font')
+parser.add_argument('--index', type=Path, default=None, help='index module for --sheet or --font, defaults to <name>_icons.py or <name>_glyphs.py')
+parser.add_argument('--delta', action="store_true", help='output deltas between each pair of input images')
+parser.add_argument('--freeze', action="store_true", help='bundle converted assets into a package of frozen modules')
 parser.add_argument('--resize', action="store_true", help='force images to 296x128 pixels')
+parser.add_argument('--cache', type=Path, default=Path('.image_converter_cache.json'), help='build cache file')
+parser.add_argument('--no_cache', action="store_true", help='convert every input even if its output is up to date')
+parser.add_argument('--jobs', type=int, default=1, help='number of worker processes, 0 for one per CPU')
 
-options = parser.parse_args()
 
+# "\\xNN" escape for every byte value, looked up in bulk by write_bytes()
+BYTE_ESCAPES = ['\\x{:02x}'.format(i) for i in range(256)]
 
-class ByteWriter(object):
-  bytes_per_line = 16
 
-  def __init__(self, stream, varname):
-    self.stream = stream
-    self.stream.write('{} =\\\n'.format(varname))
-    self.bytecount = 0  # For line breaks
+def write_bytes(stream, varname, data, bytes_per_line=16):
+  stream.write('{} =\\\n'.format(varname))
+  escaped = ''.join(map(BYTE_ESCAPES.__getitem__, data))
+  chars_per_line = bytes_per_line * 4
+  lines = [escaped[i:i + chars_per_line] for i in range(0, len(escaped), chars_per_line)]
+  if lines:
+    stream.write("b'")
+    stream.write("'\\\nb'".join(lines))
+    # A full last line keeps its continuation, same as data_to_py.py
+    stream.write("'\\\n" if len(data) % bytes_per_line == 0 else "'\n")
+  stream.write('\n')
 
-  def _eol(self):
-    self.stream.write("'\\\n")
 
-  def _eot(self):
-    self.stream.write("'\n")
+# The stages of convert_image(), kept separate so converter_benchmark.py can
+# time each one.
+def resize_image(img):
+  return img.resize((296, 128))
 
-  def _bol(self):
-    self.stream.write("b'")
 
-  # Output a single byte
-  def obyte(self, data):
-    if not self.bytecount:
-      self._bol()
-    self.stream.write('\\x{:02x}'.format(data))
-    self.bytecount += 1
-    self.bytecount %= self.bytes_per_line
-    if not self.bytecount:
-      self._eol()
+def enhance_contrast(img):
+  try:
+    enhancer = ImageEnhance.Contrast(img)
+    return enhancer.enhance(2.0)
+  except ValueError:
+    return img
 
-  # Output from a sequence
-  def odata(self, bytelist):
-    for byt in bytelist:
-      self.obyte(byt)
 
-  # ensure a correct final line
-  def eot(self):  # User force EOL if one hasn't occurred
-    if self.bytecount:
-      self._eot()
-    self.stream.write('\n')
+def dither(img):
+  return img.convert("1")  # convert to black and white
 
 
-def convert_image(img):
-  if options.resize:
-    img = img.resize((296, 128))  # resize
-  try:
-    enhancer = ImageEnhance.Contrast(img)
-    img = enhancer.enhance(2.0)
-  except ValueError:
-    pass
-  img = img.convert("1")  # convert to black and white
+def convert_image(img, resize=False):
+  if resize:
+    img = resize_image(img)
+  img = enhance_contrast(img)
+  img = dither(img)
   return img
 
 
-def write_stream(header, footer, ip_stream, op_stream):
+def pack_image(img):
+  # The "1;I" raw packer inverts and packs 8 pixels per byte in C, so the
+  # whole frame goes straight from PIL to bytes without per-pixel objects.
+  return img.tobytes("raw", "1;I")
+
+
+def packbits(data):
+  # PackBits: a header n < 128 is followed by n + 1 literal bytes, a header
+  # n > 128 repeats the next byte 257 - n times.
+  out = bytearray()
+  i = 0
+  size = len(data)
+  while i < size:
+    run = 1
+    while i + run < size and run < 128 and data[i + run] == data[i]:
+      run += 1
+    if run > 1:
+      out.append(257 - run)
+      out.append(data[i])
+      i += run
+      continue
+
+    start = i
+    i += 1
+    while i < size and i - start < 128 and (i + 1 >= size or data[i] != data[i + 1]):
+      i += 1
+    out.append(i - start - 1)
+    out += data[start:i]
+  return bytes(out)
+
+
+def encode_rle(data, width):
+  # Rows are encoded separately so the device can decode one row at a time.
+  stride = (width + 7) // 8
+  return b''.join(packbits(data[i:i + stride]) for i in range(0, len(data), stride))
+
+
+def delta_spans(source, target, stride, gap=3):
+  # Spans of bytes that differ (source XOR target is non-zero), split at row
+  # boundaries. Spans closer than a record header are merged.
+  spans = []
+  for row in range(len(target) // stride):
+    start = row * stride
+    changed = [col for col in range(stride) if source[start + col] ^ target[start + col]]
+    span = None
+    for col in changed:
+      if span is not None and col - span[1] <= gap:
+        span[1] = col + 1
+      else:
+        if span is not None:
+          spans.append((row, *span))
+        span = [col, col + 1]
+    if span is not None:
+      spans.append((row, *span))
+  return spans
+
+
+def encode_delta(source, target, width):
+  """
+  A 4 byte header with the changed rows and byte columns (first, last + 1),
+  then one record per span: row, byte column and byte length, followed by
+  the target's bytes for the span, PackBits-compressed.
+
+  The records hold the target's bytes rather than the XOR, as the display
+  can only draw over its framebuffer, not combine with it.
+  """
+  stride = (width + 7) // 8
+  spans = delta_spans(source, target, stride)
+  if not spans:
+    return bytes(4)
+
+  out = bytearray([
+      spans[0][0],
+      spans[-1][0] + 1,
+      min(span[1] for span in spans),
+      max(span[2] for span in spans),
+  ])
+  for row, start, end in spans:
+    out += bytes([row, start, end - start])
+    out += packbits(target[row * stride + start:row * stride + end])
+  return bytes(out)
+
+
+def convert_deltas(options):
+  if len(options.file) % 2:
+    parser.error('--delta needs pairs of images')
+
+  logs = []
+  for source_filename, target_filename in zip(options.file[::2], options.file[1::2]):
+    frames = []
+    for input_filename in (source_filename, target_filename):
+      with Image.open(input_filename) as img:
+        img = convert_image(img, options.resize)
+        frames.append((Path(input_filename).stem, img.size, pack_image(img)))
+
+    if frames[0][1] != frames[1][1]:
+      parser.error(f'{source_filename} and {target_filename} must be the same size')
+
+    for (source_name, _, source), (target_name, (w, h), target) in (frames, frames[::-1]):
+      output_filename = output_path(f'{source_name}_to_{target_name}', options.out_dir, ".delta")
+      delta = encode_delta(source, target, w)
+      with open(output_filename, "wb") as out:
+        out.write(delta)
+      logs.append(f"Saving to {output_filename}, {len(delta)} bytes, {target_name}.rle is {len(encode_rle(target, w))} bytes")
+  return logs
+
+
+def write_stream(header, footer, ip_stream, op_stream, bytes_per_line=16):
   op_stream.write(header)
   op_stream.write('\n')
   data = ip_stream.read()
-  bw_data = ByteWriter(op_stream, '_data')
-  bw_data.odata(data)
-  bw_data.eot()
+  write_bytes(op_stream, '_data', data, bytes_per_line)
   op_stream.write(footer)
 
 
-# create map of images based on input filenames
-for input_filename in options.file:
+def icon_name(input_filename):
+  # "1-ball.png" -> "ball", the numeric prefix only orders the sheet
+  return re.sub(r'^\d+[-_]', '', Path(input_filename).stem)
+
+
+def icon_constant(name):
+  # "ball" -> "BALL", made a valid identifier: "2-seam" -> "_2_SEAM"
+  constant = re.sub(r'[^0-9A-Za-z_]', '_', name).upper()
+  if not constant or constant[0].isdigit():
+    constant = f'_{constant}'
+  return constant
+
+
+def write_index(stream, sheet_filename, size, names):
+  stream.write(INDEX_HEADER)
+  stream.write('\n')
+  stream.write(f"SHEET = '{sheet_filename}'\n")
+  stream.write(f'SIZE = {size}\n')
+  stream.write(f'COUNT = {len(names)}\n')
+  stream.write(f'NAMES = {tuple(names)!r}\n')
+  stream.write('\n')
+  for index, name in enumerate(names):
+    stream.write(f'{icon_constant(name)} = {index}\n')
+
+
+def load_icon(input_filename, options):
+  with Image.open(input_filename) as icon:
+    return icon.convert('RGBA')
+
+
+def convert_sheet(options, cache=None):
+  names = [icon_name(input_filename) for input_filename in options.file]
+  if len(set(names)) != len(names):
+    parser.error('icon names must be unique')
+  constants = [icon_constant(name) for name in names]
+  if len(set(constants)) != len(constants):
+    parser.error('icon names must be unique once made into identifiers')
+  clashes = set(constants) & {'SHEET', 'SIZE', 'COUNT', 'NAMES'}
+  if clashes:
+    parser.error(f'icon names clash with the index: {", ".join(sorted(clashes))}')
+
+  sheet_filename = output_path(options.sheet, options.out_dir, ".bin")
+  index_filename = options.index or Path(f'{options.sheet}_icons.py')
+
+  def convert():
+    icons = run_jobs(load_icon, options.file, options)
+    size = icons[0].height
+    if any(icon.size != (size, size) for icon in icons):
+      parser.error(f'icons must all be {size}x{size} pixels')
+
+    # Paste the sources side by side and convert the sheet as a whole, as
+    # the contrast and dither steps depend on the whole image.
+    sheet = Image.new('RGBA', (size * len(icons), size))
+    for index, icon in enumerate(icons):
+      sheet.paste(icon, (size * index, 0))
+
+    with open(sheet_filename, "wb") as out:
+      out.write(pack_image(convert_image(sheet)))
+
+    with open(index_filename, "w") as out:
+      write_index(out, sheet_filename.name, size, names)
+
+    return [
+        f"Saving to {sheet_filename}, {sheet.width}x{sheet.height}, {len(names)} icons",
+        f"Saving to {index_filename}",
+    ]
+
+  if cache is None:
+    return convert()
+  # The icon names and the sheet's name end up in the index module
+  key = cache.digest(['sheet', sheet_filename.name, names], options.file)
+  return cache.build([sheet_filename, index_filename], key, convert)
+
+
+def freeze_assets(options):
+  # Module names must match blaseball2040.assets.module_name()
+  out_dir = options.out_dir or Path('blaseball2040_assets')
+  out_dir.mkdir(parents=True, exist_ok=True)
+  files = ['__init__.py']
+  logs = []
+  for input_filename in options.file:
+    output_filename = out_dir / (Path(input_filename).name.replace('.', '_') + '.py')
+    with open(input_filename, "rb") as ip, open(output_filename, "w") as out:
+      write_stream(PY_HEADER, PY_FOOTER, ip, out, options.bytes_per_line)
+    files.append(output_filename.name)
+    logs.append(f"Saving to {output_filename}")
+
+  with open(out_dir / '__init__.py', "w") as out:
+    out.write(PY_HEADER)
+
+  # Include this from the board manifest to freeze the package
+  manifest_filename = out_dir / 'manifest.py'
+  with open(manifest_filename, "w") as out:
+    out.write(MANIFEST.format(package=out_dir.name, files=files))
+  logs.append(f"Saving to {manifest_filename}")
+  return logs
+
+
+def load_hershey(name):
+  # The badge strokes its text from the same Hershey fonts, "sans" is futural
+  try:
+    from HersheyFonts import HersheyFonts
+  except ImportError:
+    parser.error('--font needs the Hershey-Fonts package (pip install Hershey-Fonts)')
+  font = HersheyFonts()
+  try:
+    font.load_default_font(name)
+  except ValueError:
+    parser.error(f'no Hershey font named {name!r}')
+  return font.all_glyphs
+
+
+def rasterize_glyph(glyph, height, thickness):
+  # Strokes the glyph the way the badge does: vertices scaled by the line
+  # height over 30 and truncated, centred on the middle of the line, and each
+  # line drawn with a square brush `thickness` wide.
+  scale = height / HERSHEY_LINE_HEIGHT
+  width = max(int(glyph.char_width * scale), 1)
+  # Glyphs are stored padded to whole bytes, so each is one contiguous image
+  img = Image.new("1", ((width + 7) // 8 * 8, height), 1)
+  draw = ImageDraw.Draw(img)
+  for stroke in glyph.strokes:
+    points = [(int((x - glyph.left_offset) * scale), height // 2 + int(y * scale)) for x, y in stroke]
+    for (x1, y1), (x2, y2) in zip(points, points[1:]):
+      steps = max(abs(x2 - x1), abs(y2 - y1), 1)
+      for step in range(steps + 1):
+        x = x1 - thickness // 2 + round((x2 - x1) * step / steps)
+        y = y1 - thickness // 2 + round((y2 - y1) * step / steps)
+        draw.rectangle((x, y, x + thickness - 1, y + thickness - 1), fill=0)
+  # Anything the brush left in the padding isn't part of the glyph
+  draw.rectangle((width, 0, img.width, height), fill=1)
+  return width, pack_image(img)
+
+
+def write_font_index(stream, atlas_filename, sizes):
+  stream.write(INDEX_HEADER)
+  stream.write('\n')
+  stream.write(f"ATLAS = '{atlas_filename}'\n")
+  stream.write('\n')
+  stream.write('# line height: (characters, widths, offsets into ATLAS)\n')
+  stream.write('SIZES = {\n')
+  for height, (chars, widths, offsets) in sorted(sizes.items()):
+    stream.write(f'    {height}: ({chars!r}, {tuple(widths)!r}, {tuple(offsets)!r}),\n')
+  stream.write('}\n')
+
+
+def glyph_specs(options):
+  # {line height: characters} from the --glyphs options
+  specs = {}
+  for spec in options.glyphs:
+    height, _, chars = spec.partition(':')
+    if not height.isdigit() or not chars:
+      parser.error(f'--glyphs must be HEIGHT:CHARS, not {spec!r}')
+    height = int(height)
+    specs[height] = ''.join(sorted(set(chars + specs.get(height, ''))))
+  return specs
+
+
+def rasterize_size(spec, options):
+  # Every glyph of one line height, run as a job
+  height, chars = spec
+  glyphs = load_hershey(options.hershey)
+  return [rasterize_glyph(glyphs[char], height, options.thickness) for char in chars]
+
+
+def convert_font(options, cache=None):
+  specs = list(glyph_specs(options).items())
+  atlas_filename = output_path(options.font, options.out_dir, ".bin")
+  index_filename = options.index or Path(f'{options.font}_glyphs.py')
+
+  def convert():
+    atlas = bytearray()
+    sizes = {}
+    for (height, chars), glyphs in zip(specs, run_jobs(rasterize_size, specs, options)):
+      widths = []
+      offsets = []
+      for width, data in glyphs:
+        widths.append(width)
+        offsets.append(len(atlas))
+        atlas += data
+      sizes[height] = (chars, widths, offsets)
+
+    with open(atlas_filename, "wb") as out:
+      out.write(atlas)
+
+    with open(index_filename, "w") as out:
+      write_font_index(out, atlas_filename.name, sizes)
+
+    return [
+        f"Saving to {atlas_filename}, {sum(len(chars) for chars, _, _ in sizes.values())} glyphs, {len(atlas)} bytes",
+        f"Saving to {index_filename}",
+    ]
+
+  if cache is None:
+    return convert()
+  key = cache.digest(['font', atlas_filename.name, specs, options.hershey, options.thickness], [])
+  return cache.build([atlas_filename, index_filename], key, convert)
+
+
+def expand_inputs(filenames, pattern='*.png'):
+  inputs = []
+  for filename in filenames:
+    path = Path(filename)
+    if path.is_dir():
+      inputs.extend(str(child) for child in sorted(path.glob(pattern)))
+    else:
+      inputs.append(filename)
+  return inputs
+
+
+def output_path(input_filename, out_dir, suffix):
+  if out_dir is not None:
+    return (out_dir / Path(input_filename).stem).with_suffix(suffix)
+  return Path(input_filename).with_suffix(suffix)
+
+
+def output_filename_for(input_filename, options):
+  if options.binary:
+    return output_path(input_filename, options.out_dir, ".bin")
+  elif options.rle:
+    return output_path(input_filename, options.out_dir, ".rle")
+  elif options.py:
+    return output_path(input_filename, options.out_dir, ".py")
+  return None
+
+
+def file_digest(filename):
+  with open(filename, "rb") as f:
+    return hashlib.sha256(f.read()).hexdigest()
+
+
+class BuildCache(object):
+  """
+  Maps each output file to a hash of the input bytes, the options that
+  affect the output and the converter version, plus a hash of the output
+  itself so edited or deleted outputs are rebuilt too.
+  """
+
+  def __init__(self, path):
+    self.path = path
+    self.hits = 0
+    self.misses = 0
+    try:
+      with open(path) as f:
+        self.entries = json.load(f)
+    except (OSError, ValueError):
+      self.entries = {}
+
+  def digest(self, params, input_filenames):
+    digest = hashlib.sha256(json.dumps([CONVERTER_VERSION, *params]).encode())
+    for input_filename in input_filenames:
+      with open(input_filename, "rb") as f:
+        digest.update(f.read())
+    return digest.hexdigest()
+
+  def key(self, input_filename, options):
+    return self.digest([
+        options.resize,
+        options.binary,
+        options.rle,
+        options.py,
+        options.bytes_per_line,
+    ], [input_filename])
+
+  def build(self, output_filenames, key, convert):
+    # Runs convert() unless every output it writes is fresh for `key`
+    if all(self.fresh(output_filename, key) for output_filename in output_filenames):
+      self.hits += 1
+      return [f"Up to date: {output_filename}" for output_filename in output_filenames]
+
+    self.misses += 1
+    logs = convert()
+    for output_filename in output_filenames:
+      self.store(output_filename, key)
+    return logs
+
+  def fresh(self, output_filename, key):
+    entry = self.entries.get(str(output_filename))
+    if entry is None or entry["key"] != key:
+      return False
+    try:
+      return file_digest(output_filename) == entry["output"]
+    except OSError:
+      return False
+
+  def store(self, output_filename, key):
+    self.entries[str(output_filename)] = {
+        "key": key,
+        "output": file_digest(output_filename),
+    }
+
+  def save(self):
+    with open(self.path, "w") as f:
+      json.dump(self.entries, f, indent=2, sort_keys=True)
+
+  def report(self):
+    return f"Cache: {self.hits} hit{'' if self.hits == 1 else 's'}, {self.misses} miss{'' if self.misses == 1 else 'es'}"
+
+
+def convert_file(input_filename, options):
+  # Runs in a worker process when --jobs is used, so it returns its log
+  # output instead of printing and the parent prints it in input order.
   with Image.open(input_filename) as img:
-    img = convert_image(img)
+    img = convert_image(img, options.resize)
 
     image_name = Path(input_filename).stem
 
     w, h = img.size
 
-    output_data = [~b & 0xff for b in list(img.tobytes())]
+    output_data = pack_image(img)
 
     if options.binary:
-      if options.out_dir is not None:
-        output_filename = (options.out_dir / image_name).with_suffix(".bin")
-      else:
-        output_filename = Path(input_filename).with_suffix(".bin")
-      print(f"Saving to {output_filename}, {w}x{h}")
+      output_filename = output_filename_for(input_filename, options)
+      with open(output_filename, "wb") as out:
+        out.write(output_data)
+      return f"Saving to {output_filename}, {w}x{h}"
+    elif options.rle:
+      output_filename = output_filename_for(input_filename, options)
+      rle_data = encode_rle(output_data, w)
       with open(output_filename, "wb") as out:
-        out.write(bytearray(output_data))
+        out.write(rle_data)
+      return f"Saving to {output_filename}, {w}x{h}, {len(rle_data)}/{len(output_data)} bytes"
     elif options.py:
-      if options.out_dir is not None:
-        output_filename = (options.out_dir / image_name).with_suffix(".py")
-      else:
-        output_filename = Path(input_filename).with_suffix(".py")
-      print(f"Saving to {output_filename}, {w}x{h}")
+      output_filename = output_filename_for(input_filename, options)
       with open(output_filename, "w") as out:
-        write_stream(PY_HEADER, PY_FOOTER, io.BytesIO(bytes(output_data)), out)
+        write_stream(PY_HEADER, PY_FOOTER, io.BytesIO(output_data), out, options.bytes_per_line)
+      return f"Saving to {output_filename}, {w}x{h}"
     else:
-      image_code = '''\
+      return '''\
 static const uint8_t {image_name}[{count}] = {{
     {byte_data}
 }};
     '''.format(image_name=image_name, count=len(output_data), byte_data=", ".join(str(b) for b in output_data))
 
-      print(image_code)
+
+def run_jobs(fn, items, options):
+  # fn(item, options) for every item, across --jobs worker processes
+  jobs = options.jobs or os.cpu_count()
+  if jobs <= 1 or len(items) <= 1:
+    return list(map(fn, items, repeat(options)))
+
+  # map() yields results in submission order, which keeps the log identical
+  # to a serial run no matter which worker finishes first.
+  with ProcessPoolExecutor(max_workers=min(jobs, len(items))) as executor:
+    return list(executor.map(fn, items, repeat(options)))
+
+
+def convert_files(options, cache=None):
+  logs = {}
+  keys = {}
+  stale = []
+  for input_filename in options.file:
+    output_filename = output_filename_for(input_filename, options)
+    if cache is None or output_filename is None:
+      stale.append(input_filename)
+      continue
+
+    key = cache.key(input_filename, options)
+    if cache.fresh(output_filename, key):
+      cache.hits += 1
+      logs[input_filename] = f"Up to date: {output_filename}"
+    else:
+      cache.misses += 1
+      keys[input_filename] = (output_filename, key)
+      stale.append(input_filename)
+
+  for input_filename, log in zip(stale, run_jobs(convert_file, stale, options)):
+    logs[input_filename] = log
+    if input_filename in keys:
+      cache.store(*keys[input_filename])
+
+  return [logs[input_filename] for input_filename in options.file]
+
+
+def build_cache(options):
+  return None if options.no_cache else BuildCache(options.cache)
+
+
+def save_cache(cache):
+  if cache is not None:
+    cache.save()
+    print(cache.report())
+
+
+def main():
+  options = parser.parse_args()
+
+  if options.font is not None:
+    cache = build_cache(options)
+    for log in convert_font(options, cache):
+      print(log)
+    save_cache(cache)
+    return
+
+  if not options.file:
+    parser.error('no input files')
+
+  if options.freeze:
+    options.file = expand_inputs(options.file, '*.*')
+    for log in freeze_assets(options):
+      print(log)
+    return
+
+  options.file = expand_inputs(options.file)
+
+  if options.delta:
+    for log in convert_deltas(options):
+      print(log)
+    return
+
+  if options.sheet is not None:
+    cache = build_cache(options)
+    for log in convert_sheet(options, cache):
+      print(log)
+    save_cache(cache)
+    return
+
+  cache = None
+  if options.binary or options.rle or options.py:
+    cache = build_cache(options)
+
+  for log in convert_files(options, cache):
+    print(log)
+
+  save_cache(cache)
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Generates the outcome odds shown on the bat and catch screens.
+
+The bat screen knows the pitch and the bat, so the base is settled and
+only the catch is left to chance: a hit is fielded --catch_rate of the
+time and caught out when the catch beats the bat + 1. The catch screen
+knows the catch as well, so its outcome is certain. All the badge needs
+is the chance that a hit with each bat value is caught. That's worked out
+here from the catch distribution in game_simulator's rule options and
+saved as one byte per bat value, a whole percentage.
+
+Bat values from 0 to --max_value each have an entry, higher values share
+the last one.
+
+Writes the table to blaseball2040/assets/odds.bin and its index module to
+blaseball2040/odds.py. Freeze the table with `image_converter.py --freeze`
+so it's read straight from flash.
+"""
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+from game_simulator import distribution, rules
+
+OUTCOMES = ('strike', 'ball', 'base 1', 'base 2', 'base 3', 'homerun', 'out')
+# Short enough to fit beside the values on the screens
+LABELS = ('K', 'B', '1B', '2B', '3B', 'HR', 'O')
+
+INDEX_HEADER = """# Code generated by odds_table.py.
+"""
+
+parser = argparse.ArgumentParser(description='Generates the outcome odds shown on the bat and catch screens.', parents=[rules])
+parser.add_argument('--max_value', type=int, default=40, help='highest bat value with its own entry')
+parser.add_argument('--samples', type=int, default=10_000_000, help='values drawn to estimate each distribution')
+parser.add_argument('--seed', type=int, default=0, help='random seed')
+parser.add_argument('--out', type=Path, default=Path('blaseball2040/assets/odds.bin'), help='table file')
+parser.add_argument('--index', type=Path, default=Path('blaseball2040/odds.py'), help='index module')
+
+
+def pmf(spec: str, rng: np.random.Generator, samples: int, size: int) -> np.ndarray:
+  # The chance of each value from 0 to size - 1
+  values = distribution(spec)(rng, samples)
+  return np.bincount(np.clip(values, 0, size - 1), minlength=size) / samples
+
+
+def below(p: np.ndarray) -> np.ndarray:
+  # below(p)[v] is the chance of a value under v
+  return np.concatenate([[0.0], np.cumsum(p)[:-1]])
+
+
+def caught_odds(catch: np.ndarray, catch_rate: float, rows: int) -> np.ndarray:
+  # A hit that's fielded is out when the catch beats the bat + 1
+  catch_below = below(catch)
+  return catch_rate * (1 - catch_below[2:rows + 2])
+
+
+def write_index(stream, table_filename: str, values: int, options):
+  stream.write(INDEX_HEADER)
+  stream.write(f'# catch {options.catch}, catch rate {options.catch_rate}\n')
+  stream.write('\n')
+  stream.write(f"TABLE = '{table_filename}'\n")
+  stream.write(f'VALUES = {values}\n')
+  stream.write(f'COUNT = {len(OUTCOMES)}\n')
+  stream.write(f'NAMES = {OUTCOMES!r}\n')
+  stream.write(f'LABELS = {LABELS!r}\n')
+  stream.write('\n')
+  for index, name in enumerate(OUTCOMES):
+    stream.write(f"{name.replace(' ', '_').upper()} = {index}\n")
+
+
+def main():
+  options = parser.parse_args()
+  try:
+    distribution(options.catch)
+  except ValueError as e:
+    parser.error(str(e))
+  if options.max_value < 0:
+    parser.error('--max_value must be at least 0')
+
+  rng = np.random.default_rng(options.seed)
+  rows = options.max_value + 1
+  # Room for the catch to beat the highest bat + 1
+  size = max(rows + 2, int(distribution(options.catch)(rng, options.samples).max()) + 3)
+  catch = pmf(options.catch, rng, options.samples, size)
+
+  table = np.rint(caught_odds(catch, options.catch_rate, rows) * 100).astype(np.uint8)
+  options.out.parent.mkdir(parents=True, exist_ok=True)
+  options.out.write_bytes(table.tobytes())
+  print(f'Saving to {options.out}, {table.nbytes} bytes')
+
+  with open(options.index, 'w') as out:
+    write_index(out, options.out.name, rows, options)
+  print(f'Saving to {options.index}')
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Benchmarks rendering each screen of the app.
+
+Boots MyApp against the host-side badger2040 stand-in in host/ and replays
+scripted button presses through the same event handling the badge uses.
+For every screen it reports how often it was presented, the time spent in
+its build() and in the whole present (render, frame diff and panel
+update), the number of display calls and the peak memory the app's own code
+(blaseball2040 and badger_ui, not the stand-in display) allocated while
+presenting it. That peak is sampled from filtered snapshots taken at every
+display call. Once the script ends and its last screen is dismissed, it
+reports how much the app's code still holds, and how the refreshes were
+scheduled.
+
+Scripts:
+  at_bat       from the stat screen: a strike, a ball, a strike and a hit
+               that's caught short, with runs scored
+  half_inning  an at-bat then three outs caught in the field
+  game         a half inning for each team, to the score screen and back
+               to the splash screen
+
+Results can be saved with --json and compared between commits.
+"""
+
+import argparse
+import fnmatch
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'host'))
+
+# Allocations made by these are the app's, the rest are the stand-in's
+APP_CODE = (
+    tracemalloc.Filter(True, '*/blaseball2040/*'),
+    tracemalloc.Filter(True, '*/badger_ui/*'),
+)
+
+import badger2040  # noqa: E402
+
+from blaseball2040.app import MyApp  # noqa: E402
+
+BUTTONS = {
+    'A': badger2040.BUTTON_A,
+    'B': badger2040.BUTTON_B,
+    'C': badger2040.BUTTON_C,
+    'UP': badger2040.BUTTON_UP,
+    'DOWN': badger2040.BUTTON_DOWN,
+    'USER': badger2040.BUTTON_USER,
+}
+
+# Splash to select to the stat screen
+BOOT = [('B', 1), ('B', 1)]
+
+# Each play starts and ends on the stat screen. Pitch and bat start at 10,
+# a catch at 10 against the bat + 1.
+STRIKE = [('B', 1), ('B', 1), ('DOWN', 2), ('B', 1), ('B', 1)]
+BALL = [('B', 1), ('B', 1), ('B', 1), ('B', 1)]
+HIT = [('B', 1), ('UP', 3), ('B', 1), ('UP', 5), ('B', 1), ('B', 1), ('UP', 2), ('B', 1), ('UP', 1), ('B', 1)]
+CAUGHT_OUT = [('B', 1), ('UP', 3), ('B', 1), ('UP', 5), ('B', 1), ('B', 1), ('UP', 10), ('B', 1), ('B', 1)]
+
+AT_BAT = STRIKE + BALL + STRIKE + HIT
+HALF_INNING = AT_BAT + CAUGHT_OUT * 3
+
+SCRIPTS = {
+    'at_bat': BOOT + AT_BAT,
+    'half_inning': BOOT + HALF_INNING,
+    # The last out of the bottom half goes to the score screen
+    'game': BOOT + HALF_INNING * 2 + [('B', 1)],
+}
+
+parser = argparse.ArgumentParser(description='Benchmarks rendering each screen of the app.')
+parser.add_argument('script', nargs='*', default=list(SCRIPTS), help='scripts to run')
+parser.add_argument('--repeat', type=int, default=3, help='runs per script, the fastest is reported')
+parser.add_argument('--json', type=Path, default=None, help='save results as JSON')
+
+
+# Whether each traced filename is the app's, so sampling doesn't match every
+# trace against APP_CODE's patterns each time
+_app_files: dict[str, bool] = {}
+
+
+def app_file(filename: str) -> bool:
+  app = _app_files.get(filename)
+  if app is None:
+    app = _app_files[filename] = any(fnmatch.fnmatch(filename, code.filename_pattern) for code in APP_CODE)
+  return app
+
+
+def app_held() -> int:
+  # Bytes currently allocated by the app's own code, from a snapshot filtered
+  # the way Snapshot.filter_traces(APP_CODE) would, by each trace's most
+  # recent frame
+  return sum(trace.size for trace in tracemalloc.take_snapshot().traces if app_file(trace.traceback[0].filename))
+
+
+class Recorder:
+  """
+  Wraps an app's present methods and its screens' build methods to
+  attribute time, display calls and memory to the screen being presented.
+  """
+
+  def __init__(self, app: MyApp, trace: bool):
+    self.app = app
+    self.trace = trace
+    self.screens: dict[str, dict] = {}
+    self.built: set[int] = set()
+    # Most app code held at any display call of the present being traced
+    self.held = 0
+
+    for method in ('present', 'present_damage'):
+      setattr(app, method, self.timed(getattr(app, method)))
+    if trace:
+      app.display.record = self.sampled(app.display.record)
+
+  def sampled(self, record):
+    def wrapper(*args):
+      self.held = max(self.held, app_held())
+      record(*args)
+    return wrapper
+
+  def stats(self, screen) -> dict:
+    name = type(screen).__name__
+    stats = self.screens.get(name)
+    if stats is None:
+      stats = self.screens[name] = {
+          'presents': 0,
+          'build_seconds': 0.0,
+          'present_seconds': 0.0,
+          'draw_calls': 0,
+          'peak_bytes': 0,
+      }
+    if id(screen) not in self.built:
+      self.built.add(id(screen))
+      # The splash screen draws its art without building a widget tree
+      build = getattr(screen, 'build', None)
+      if build is not None:
+        screen.build = self.timed_build(screen, build)
+    return stats
+
+  def timed_build(self, screen, build):
+    def wrapper(*args):
+      start = time.perf_counter()
+      build(*args)
+      self.stats(screen)['build_seconds'] += time.perf_counter() - start
+    return wrapper
+
+  def timed(self, present):
+    def wrapper(*args, **kwargs):
+      stats = self.stats(self.app.child)
+      if self.trace:
+        # The stand-in's call log only grows, and every snapshot would have
+        # to walk it
+        self.app.display.calls.clear()
+        before = self.held = app_held()
+      calls = len(self.app.display.calls)
+
+      start = time.perf_counter()
+      present(*args, **kwargs)
+      stats['present_seconds'] += time.perf_counter() - start
+
+      if self.trace:
+        self.held = max(self.held, app_held())
+        stats['peak_bytes'] = max(stats['peak_bytes'], self.held - before)
+      stats['presents'] += 1
+      stats['draw_calls'] += len(self.app.display.calls) - calls
+    return wrapper
+
+
+def play(steps, trace: bool) -> tuple[MyApp, Recorder]:
+  app = MyApp()
+  recorder = Recorder(app, trace)
+  app.present(transition=True)
+  for button, amount in steps:
+    app.handle([[BUTTONS[button], amount]])
+  return app, recorder
+
+
+def run_script(steps) -> tuple[MyApp, Recorder]:
+  return play(steps, trace=False)
+
+
+def trace_script(steps) -> tuple[dict[str, dict], int]:
+  # The per-screen peaks, and what the app still holds after the script
+  tracemalloc.start()
+  try:
+    before = app_held()
+    app, recorder = play(steps, trace=True)
+    app.dismiss(app.child)
+    retained = app_held() - before
+  finally:
+    tracemalloc.stop()
+  return recorder.screens, retained
+
+
+def benchmark(name, steps, options):
+  runs = [run_script(steps) for _ in range(options.repeat)]
+  app, recorder = min(runs, key=lambda run: sum(stats['present_seconds'] for stats in run[1].screens.values()))
+  peaks, retained = trace_script(steps)
+
+  screens = recorder.screens
+  for screen, stats in screens.items():
+    stats['peak_bytes'] = peaks[screen]['peak_bytes']
+  return {
+      'script': name,
+      'steps': len(steps),
+      'screen': type(app.child).__name__,
+      'screens': screens,
+      'total_seconds': sum(stats['present_seconds'] for stats in screens.values()),
+      'retained_bytes': retained,
+      'refresh': app.refresh.report(),
+  }
+
+
+def report(result):
+  print(f"{result['script']}: {result['steps']} steps, {result['total_seconds'] * 1000:.1f} ms, ends on {result['screen']}")
+  print(f"  {'screen':<16}{'presents':>9}{'build':>12}{'present':>12}{'calls':>8}{'peak':>12}")
+  for screen, stats in result['screens'].items():
+    print(
+        f"  {screen:<16}{stats['presents']:>9}"
+        f"{stats['build_seconds'] * 1000:>9.2f} ms{stats['present_seconds'] * 1000:>9.2f} ms"
+        f"{stats['draw_calls']:>8}{stats['peak_bytes'] / 1024:>8.1f} KiB"
+    )
+  print(f"  retained: {result['retained_bytes'] / 1024:.1f} KiB")
+  print(f"  refreshes: {result['refresh']}")
+
+
+def main():
+  options = parser.parse_args()
+  results = []
+  for name in options.script:
+    if name not in SCRIPTS:
+      parser.error(f'unknown script {name}')
+    result = benchmark(name, SCRIPTS[name], options)
+    report(result)
+    results.append(result)
+
+  if options.json is not None:
+    with open(options.json, 'w') as f:
+      json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Simulates a round-robin season across a process pool.
+
+Every team plays every other team --rounds times at home and away, where
+team1 (batting first) is the away team. The teams are the app's own from
+blaseball2040.teams, or a generated league of --teams teams whose skill is
+drawn from a normal distribution with --spread.
+
+The schedule is split into fixed chunks, each simulated by
+game_simulator.simulate() with its own seed spawned from --seed. Workers
+send back per-team totals, which are summed into the standings. As the
+chunks and their seeds don't depend on --jobs, a season comes out the same
+on any number of cores.
+
+--benchmark plays the season with 1 up to --jobs workers and reports the
+throughput in games per second for each.
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from blaseball2040.teams import teams as app_teams
+from game_simulator import rules, simulate
+
+parser = argparse.ArgumentParser(description='Simulates a round-robin season across a process pool.', parents=[rules])
+parser.add_argument('--teams', type=int, default=0, help='generate a league of this many teams instead of the app\'s')
+parser.add_argument('--spread', type=float, default=2.0, help='standard deviation of generated team skill')
+parser.add_argument('--rounds', type=int, default=1, help='home and away games per pair of teams')
+parser.add_argument('--chunk', type=int, default=50_000, help='games per task')
+parser.add_argument('--jobs', type=int, default=os.cpu_count(), help='worker processes')
+parser.add_argument('--seed', type=int, default=0, help='random seed')
+parser.add_argument('--top', type=int, default=20, help='teams to list from the top and bottom of the standings')
+parser.add_argument('--benchmark', action='store_true', help='time the season with 1 up to --jobs workers')
+parser.add_argument('--json', type=Path, default=None, help='save results as JSON')
+
+# Per-team totals, each an array indexed by team
+COLUMNS = ('wins', 'losses', 'ties', 'runs_for', 'runs_against', 'unfinished')
+
+
+def league(options) -> tuple[list[str], np.ndarray]:
+  if not options.teams:
+    return list(app_teams), np.zeros(len(app_teams), np.int16)
+
+  rng = np.random.default_rng([options.seed, 1])
+  names = [f'TEAM {index + 1}' for index in range(options.teams)]
+  return names, np.rint(rng.normal(0, options.spread, options.teams)).astype(np.int16)
+
+
+def schedule(count: int, rounds: int) -> tuple[np.ndarray, np.ndarray]:
+  # Every ordered pair, so each pair meets once with each team away
+  away, home = np.nonzero(~np.eye(count, dtype=bool))
+  return np.tile(away, rounds), np.tile(home, rounds)
+
+
+def play_chunk(task) -> dict[str, np.ndarray]:
+  away, home, skill, seed, count, options = task
+  rng = np.random.default_rng(seed)
+  results = simulate(len(away), rng, options, skill[away], skill[home])
+  score1, score2 = results['score1'], results['score2']
+  unfinished = results['unfinished']
+
+  def total(games, teams, weights=None):
+    # Sums `weights` (or counts the games) for each team over `games`
+    return np.bincount(teams[games], None if weights is None else weights[games], minlength=count).astype(np.int64)
+
+  def both(games, weights1=None, weights2=None):
+    return total(games, away, weights1) + total(games, home, weights2)
+
+  finished = ~unfinished
+  return {
+      'wins': total(finished & (score1 > score2), away) + total(finished & (score2 > score1), home),
+      'losses': total(finished & (score1 < score2), away) + total(finished & (score2 < score1), home),
+      'ties': both(finished & (score1 == score2)),
+      'runs_for': both(finished, score1, score2),
+      'runs_against': both(finished, score2, score1),
+      'unfinished': both(unfinished),
+  }
+
+
+def tasks(options, skill: np.ndarray):
+  away, home = schedule(len(skill), options.rounds)
+  chunks = range(0, len(away), options.chunk)
+  seeds = np.random.SeedSequence(options.seed).spawn(len(chunks))
+  for first, seed in zip(chunks, seeds):
+    last = first + options.chunk
+    yield away[first:last], home[first:last], skill, seed, len(skill), options
+
+
+def play_season(options, skill: np.ndarray, jobs: int) -> dict[str, np.ndarray]:
+  totals = {column: np.zeros(len(skill), np.int64) for column in COLUMNS}
+  if jobs > 1:
+    with ProcessPoolExecutor(jobs) as executor:
+      results = executor.map(play_chunk, tasks(options, skill))
+      for result in results:
+        for column in COLUMNS:
+          totals[column] += result[column]
+  else:
+    for task in tasks(options, skill):
+      result = play_chunk(task)
+      for column in COLUMNS:
+        totals[column] += result[column]
+  return totals
+
+
+def standings(names: list[str], skill: np.ndarray, totals: dict[str, np.ndarray]) -> list[dict]:
+  played = totals['wins'] + totals['losses'] + totals['ties']
+  # Ties count as half a win
+  pct = (totals['wins'] + totals['ties'] / 2) / np.maximum(played, 1)
+  order = np.lexsort((-(totals['runs_for'] - totals['runs_against']), -pct))
+  return [
+      {
+          'team': names[index],
+          'skill': int(skill[index]),
+          'played': int(played[index]),
+          **{column: int(totals[column][index]) for column in COLUMNS},
+          'pct': float(pct[index]),
+      }
+      for index in order
+  ]
+
+
+def report(table: list[dict], games: int, seconds: float, top: int):
+  print(f'{games:,} games in {seconds:.2f} s, {games / seconds:,.0f} games/s')
+  print(f"  {'':>5} {'team':<24}{'skill':>6}{'W':>8}{'L':>8}{'T':>7}{'pct':>7}{'RF':>9}{'RA':>9}")
+  for rank, row in enumerate(table, 1):
+    if top and top < rank <= len(table) - top:
+      if rank == top + 1:
+        print('  ...')
+      continue
+    print(
+        f"  {rank:>5} {row['team']:<24}{row['skill']:>6}{row['wins']:>8}{row['losses']:>8}{row['ties']:>7}"
+        f"{row['pct']:>7.3f}{row['runs_for']:>9}{row['runs_against']:>9}"
+    )
+
+
+def benchmark(options, skill: np.ndarray, games: int) -> list[dict]:
+  results = []
+  for jobs in range(1, options.jobs + 1):
+    start = time.perf_counter()
+    play_season(options, skill, jobs)
+    seconds = time.perf_counter() - start
+    results.append({'jobs': jobs, 'seconds': seconds, 'games_per_second': games / seconds})
+    print(f'{jobs:>3} jobs: {seconds:.2f} s, {games / seconds:,.0f} games/s, {results[0]["seconds"] / seconds:.2f}x')
+  return results
+
+
+def main():
+  options = parser.parse_args()
+  names, skill = league(options)
+  if len(names) < 2:
+    parser.error('a season needs at least 2 teams')
+  games = len(names) * (len(names) - 1) * options.rounds
+
+  if options.benchmark:
+    results = benchmark(options, skill, games)
+  else:
+    start = time.perf_counter()
+    totals = play_season(options, skill, options.jobs)
+    seconds = time.perf_counter() - start
+    results = standings(names, skill, totals)
+    report(results, games, seconds, options.top)
+
+  if options.json is not None:
+    with open(options.json, 'w') as f:
+      json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+  main()
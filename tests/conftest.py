@@ -0,0 +1,8 @@
+import sys
+from pathlib import Path
+
+# The app imports badger2040, badger_ui, machine and micropython, which the
+# host stand-ins in host/ provide
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / 'host'))
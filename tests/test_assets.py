@@ -0,0 +1,49 @@
+import pytest
+
+from blaseball2040 import assets
+from blaseball2040.assets import AssetRegistry
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+  # A 300 byte budget over 100 byte assets, so only three fit at once
+  monkeypatch.setattr(assets, 'assets_dir', str(tmp_path))
+  for name in ('a', 'b', 'c', 'd', 'e'):
+    (tmp_path / name).write_bytes(bytes([ord(name)]) * 100)
+  (tmp_path / 'big').write_bytes(bytes(400))
+  return AssetRegistry(budget=300)
+
+
+def test_least_recently_used_is_evicted(registry):
+  for name in ('a', 'b', 'c', 'a'):
+    registry.load(name)
+  assert bytes(registry.load('d')) == b'd' * 100
+  assert sorted(registry.data) == ['a', 'c', 'd']
+  assert registry.used == 300
+  assert registry.report() == '300/300 bytes, hits: 1, misses: 4, evictions: 1'
+
+
+def test_held_assets_are_not_evicted(registry):
+  handle = registry.acquire('a')
+  assert bytes(handle.data()) == b'a' * 100
+  for name in ('b', 'c', 'd', 'e'):
+    registry.load(name)
+  assert sorted(registry.data) == ['a', 'd', 'e']
+  assert registry.report() == '300/300 bytes, hits: 0, misses: 5, evictions: 2'
+
+  # Once released it's the oldest, so it goes next
+  handle.release()
+  registry.load('b')
+  assert sorted(registry.data) == ['b', 'd', 'e']
+  assert registry.evictions == 3
+
+
+def test_assets_that_dont_fit_are_streamed(registry):
+  for name in ('a', 'b', 'c'):
+    registry.acquire(name).data()
+  assert registry.load('big') is None
+  assert registry.load('d') is None
+  assert sorted(registry.data) == ['a', 'b', 'c']
+  with registry.stream('big') as f:
+    assert len(f.read()) == 400
+  assert registry.report() == '300/300 bytes, hits: 0, misses: 5, evictions: 0'
@@ -0,0 +1,88 @@
+import pytest
+
+from blaseball2040.game import Event, Game, Inning, Screen
+
+
+def baseline(event: int, game: Game) -> int:
+  # What the screens did to the game before the rules moved into
+  # game.TRANSITIONS, one branch per screen handler. Returns the next screen.
+  if event == Event.BALL:
+    game.balls += 1
+    return Screen.BALL
+  elif event == Event.STRIKE:
+    game.strikes += 1
+    return Screen.STRIKE
+  elif event == Event.HIT:
+    return Screen.ASK_CATCH
+  elif event == Event.CAUGHT_OUT:
+    game.outs += 1
+    game.balls = 0
+    return Screen.OUT
+  elif event in (Event.SAFE, Event.NO_CATCH):
+    return Screen.RUNS
+  elif event == Event.RUNS:
+    game.strikes = 0
+    game.balls = 0
+    return Screen.STAT
+  elif event == Event.BALL_SHOWN:
+    game.balls %= 4
+    return Screen.STAT
+  elif event == Event.STRIKE_SHOWN:
+    if game.outs >= 3:
+      return Screen.OUT
+    elif game.strikes >= 3:
+      game.outs += 1
+      game.strikes = 0
+    return Screen.STAT
+  elif event == Event.OUT_SHOWN:
+    if game.outs >= 3:
+      over = game.inning == Inning.BOTTOM
+      game.inning += 1
+      game.outs = 0
+      game.strikes = 0
+      game.balls = 0
+      return Screen.SCORE if over else Screen.STAT
+    return Screen.STAT
+  elif event == Event.BALLS_ADDED:
+    return Screen.BALL if game.balls >= 4 else Screen.STAT
+  elif event == Event.STRIKES_ADDED:
+    return Screen.STRIKE if game.strikes >= 3 else Screen.STAT
+  elif event == Event.OUTS_ADDED:
+    return Screen.OUT if game.outs >= 3 else Screen.STAT
+  raise ValueError(f'unknown event {event}')
+
+
+def counts(game: Game) -> tuple[int, int, int, int]:
+  return game.balls, game.strikes, game.outs, game.inning
+
+
+@pytest.mark.parametrize('event', range(Event.COUNT))
+def test_transitions_match_baseline(event):
+  for inning in (Inning.TOP, Inning.BOTTOM, Inning.OVER):
+    for outs in range(5):
+      for strikes in range(5):
+        for balls in range(6):
+          game = Game('a', 'b', inning=inning, outs=outs, strikes=strikes, balls=balls)
+          expected = Game('a', 'b', inning=inning, outs=outs, strikes=strikes, balls=balls)
+          state = counts(game)
+          assert (game.apply(event), counts(game)) == (baseline(event, expected), counts(expected)), state
+
+
+def test_caught_out_keeps_strikes():
+  game = Game('a', 'b', strikes=2, balls=1)
+  assert game.apply(Event.CAUGHT_OUT) == Screen.OUT
+  assert counts(game) == (0, 2, 1, Inning.TOP)
+
+
+def test_strikeout_keeps_balls():
+  game = Game('a', 'b', strikes=2, balls=3)
+  assert game.apply(Event.STRIKE) == Screen.STRIKE
+  assert game.apply(Event.STRIKE_SHOWN) == Screen.STAT
+  assert counts(game) == (3, 0, 1, Inning.TOP)
+
+
+def test_scored_runs_go_to_batting_team():
+  game = Game('a', 'b', inning=Inning.BOTTOM, strikes=1, balls=2)
+  assert game.scored(3) == Screen.STAT
+  assert (game.score1, game.score2) == (0, 3)
+  assert counts(game) == (0, 0, 0, Inning.BOTTOM)
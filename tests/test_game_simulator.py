@@ -0,0 +1,69 @@
+import argparse
+
+import numpy as np
+import pytest
+
+from game_simulator import BALL_PITCH, CAUGHT_HIT, COUNTS, SAFE_HIT, STRIKE_PITCH, UNFIELDED_HIT, distribution, simulate
+
+
+def options(**overrides) -> argparse.Namespace:
+  values = dict(
+      innings=1,
+      pitch='fixed:0',
+      bat='fixed:0',
+      catch='fixed:0',
+      catch_rate=0.0,
+      max_pitches=10,
+  )
+  values.update(overrides)
+  return argparse.Namespace(**values)
+
+
+def sequence(*values: int):
+  # A distribution that gives every game the next of `values` each pitch
+  remaining = list(values)
+  return lambda rng, size: np.full(size, remaining.pop(0), np.int16)
+
+
+def test_homerun_with_the_bases_loaded_scores_four():
+  # Three singles load the bases, then a homerun
+  results = simulate(3, np.random.default_rng(0), options(bat=sequence(1, 1, 1, 4), max_pitches=4))
+  assert results['score1'].tolist() == [4, 4, 4]
+  assert results['unfinished'].all()
+
+
+def test_walk_with_the_bases_loaded_scores_one():
+  # Three singles, then four balls
+  results = simulate(1, np.random.default_rng(0), options(bat=sequence(1, 1, 1, 0, 0, 0, 0), max_pitches=7))
+  assert results['score1'].tolist() == [1]
+
+
+def test_three_outs_switch_sides():
+  # Every hit is a single that's caught, so each half is three pitches
+  results = simulate(2, np.random.default_rng(0), options(bat='fixed:1', catch='fixed:5', catch_rate=1.0))
+  assert results['pitches'].tolist() == [6, 6]
+  assert not results['unfinished'].any()
+  assert (results['score1'] == 0).all() and (results['score2'] == 0).all()
+
+
+@pytest.mark.parametrize('pitch, balls, strikes, outs, expected', [
+    # A caught out keeps the strikes
+    (CAUGHT_HIT, 1, 2, 0, (0, 2, 1, 0)),
+    # The third out clears the count and switches sides
+    (CAUGHT_HIT, 1, 2, 2, (0, 0, 0, 1)),
+    (STRIKE_PITCH, 3, 2, 2, (0, 0, 0, 1)),
+    # A strikeout keeps the balls, a walk keeps the strikes
+    (STRIKE_PITCH, 3, 2, 0, (3, 0, 1, 0)),
+    (BALL_PITCH, 3, 1, 0, (0, 1, 0, 0)),
+    (SAFE_HIT, 2, 1, 1, (0, 0, 1, 0)),
+    (UNFIELDED_HIT, 2, 1, 1, (0, 0, 1, 0)),
+])
+def test_counts_follow_the_app(pitch, balls, strikes, outs, expected):
+  assert tuple(COUNTS[pitch, balls, strikes, outs]) == expected
+
+
+def test_distribution_rejects_bad_specs():
+  with pytest.raises(ValueError):
+    distribution('uniform:1')
+  with pytest.raises(ValueError):
+    distribution('poisson:3')
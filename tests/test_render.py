@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+import badger2040
+from badger_ui import Offset, Size
+from badger_ui.positioned import Positioned
+
+import render_benchmark
+from blaseball2040.app import MyApp
+from blaseball2040.bitmap_text import BitmapText
+from blaseball2040.framebuffer import BANDS
+from blaseball2040.game import Game
+from blaseball2040.outcome_odds import LABEL_WIDTH, VALUE_WIDTH
+from blaseball2040.pitch_screen import BatScreen, CatchScreen
+
+
+def press(app: MyApp, *presses: tuple[str, int]):
+  # All of `presses` handled as one batch of events
+  app.handle([[render_benchmark.BUTTONS[button], amount] for button, amount in presses])
+
+
+def full_render(app: MyApp) -> np.ndarray:
+  # The current screen drawn from scratch, without its cached chrome
+  chrome = getattr(app.child, 'chrome', None)
+  if chrome is not None:
+    chrome.drop()
+  app.present()
+  return app.display.pixels()
+
+
+def inked_columns(app: MyApp, *widgets) -> np.ndarray:
+  # The columns `widgets` draw black in, rendered alone on a white frame
+  app.framebuffer[:] = bytes(len(app.framebuffer))
+  size = Size(badger2040.WIDTH, badger2040.HEIGHT)
+  for widget in widgets:
+    widget.render(app, size, Offset(0, 0))
+  columns = np.frombuffer(app.framebuffer, dtype=np.uint8).reshape(badger2040.WIDTH, BANDS)
+  return np.flatnonzero(columns.any(axis=1))
+
+
+def test_every_step_matches_a_full_render():
+  app = MyApp()
+  app.present(transition=True)
+  seen = set()
+  for step, (button, amount) in enumerate(render_benchmark.SCRIPTS['game']):
+    press(app, (button, amount))
+    shown = app.display.pixels().copy()
+    name = type(app.child).__name__
+    seen.add(name)
+    assert np.array_equal(shown, full_render(app)), f'step {step}: {name}'
+  assert len(seen) >= 10
+
+
+def test_batched_presses_leave_no_stale_chrome():
+  app = MyApp()
+  app.present(transition=True)
+  for presses in render_benchmark.BOOT + [('B', 1), ('B', 1)]:
+    press(app, presses)
+  assert isinstance(app.child, BatScreen)
+
+  # A strike, then back round to a bat screen with a new pitch, in one batch
+  press(app, ('DOWN', 2), ('B', 1), ('B', 1), ('B', 1), ('UP', 3), ('B', 1))
+  assert isinstance(app.child, BatScreen)
+  assert app.child.pitch == 13
+  shown = app.display.pixels().copy()
+  assert np.array_equal(shown, full_render(app))
+
+
+def test_glyphs_only_draw_their_own_width():
+  app = MyApp()
+  app.display.pen(0)
+  app.display.clear()
+
+  # 'A' is narrower than its padded row, the padding mustn't paint white
+  text = BitmapText('A', 30)
+  width = text.measure(app, Size(badger2040.WIDTH, badger2040.HEIGHT)).width
+  assert width % 8
+  text.render(app, Size(width, 30), Offset(0, 0))
+  assert app.display.pixels().all()
+
+
+@pytest.mark.parametrize('screen', [
+    BatScreen(Game('a', 'b'), 10),
+    CatchScreen(Game('a', 'b'), 10, 10),
+])
+def test_values_stop_short_of_the_odds(screen):
+  app = MyApp()
+  size = Size(badger2040.WIDTH, badger2040.HEIGHT)
+  screen.build(app, size, Offset(0, 0))
+  # The odds column and its labels, against everything else below the title
+  odds_x = size.width - LABEL_WIDTH - VALUE_WIDTH
+  odds = []
+  rest = []
+  for child in screen.child.children[1:]:
+    if isinstance(child, Positioned) and child.offset.x >= odds_x:
+      odds.append(child)
+    else:
+      rest.append(child)
+  odds_start = inked_columns(app, *odds).min()
+  assert odds_start >= odds_x
+
+  for value in range(101):
+    screen.pitch = screen.bat = screen.catch = value
+    screen.build(app, size, Offset(0, 0))
+    assert inked_columns(app, *rest).max() < odds_start, value